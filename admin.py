@@ -0,0 +1,31 @@
+"""
+Access control shared by the admin pages.
+"""
+import hmac
+import os
+
+import streamlit as st
+
+# The admin pages stay locked until TNS_ADMIN_PASSWORD is set.
+ADMIN_PASSWORD = os.environ.get("TNS_ADMIN_PASSWORD")
+
+
+def require_admin():
+    """
+    Shows a sign-in form and stops the page until the admin password is entered.
+    Without a configured password the page is not shown at all.
+    """
+    if not ADMIN_PASSWORD:
+        st.error("The admin pages are disabled. Set the TNS_ADMIN_PASSWORD environment variable to enable them.")
+        st.stop()
+    if st.session_state.get("is_admin"):
+        return
+    with st.form("admin_login"):
+        password = st.text_input("Admin password", type="password")
+        if st.form_submit_button("Sign in"):
+            if hmac.compare_digest(password.encode(), ADMIN_PASSWORD.encode()):
+                st.session_state.is_admin = True
+                st.rerun()
+            else:
+                st.error("Incorrect password.")
+    st.stop()
@@ -0,0 +1,242 @@
+"""
+Columnar archive of historical submissions.
+
+`compact()` rolls submissions that are not yet archived into Parquet files
+partitioned by submission month and dairy partner. Single-choice answers are
+stored as dictionary-encoded categoricals over the question's options and
+multi-select answers as integer bitmasks over its options, so the long option
+strings are stored once per file instead of once per row. Partitions that
+accumulate many small files are merged into one.
+
+`read_archive()` returns pandas frames with column projection and predicate
+pushdown (partition pruning plus Parquet row-group statistics).
+
+Usage:
+    python archive.py --db self_assessment_TNS_responses.db --archive archive
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from questions import DATE, MULTISELECT, PARTNER_KEY, RADIO, get_schema
+from submission_store import DB_FILE, SQLiteSubmissionStore
+from validation import parse_dates
+
+ARCHIVE_DIR = "archive"
+MANIFEST = "_manifest.json"
+PARTITION_COLUMNS = ["month", "dairy_partner"]
+UNKNOWN_PARTNER = "unknown"
+MAX_FILES_PER_PARTITION = 8
+
+
+def _read_manifest(archive_dir):
+    try:
+        with open(os.path.join(archive_dir, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"watermark": 0, "rows": 0}
+
+
+def _write_manifest(archive_dir, manifest):
+    fd, tmp_path = tempfile.mkstemp(dir=archive_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(archive_dir, MANIFEST))
+
+
+def _bitmask_type(options):
+    return pa.uint16() if len(options) <= 16 else pa.uint32() if len(options) <= 32 else pa.uint64()
+
+
+def _bitmask(values, options):
+    """
+    Encodes "; "-joined multi-select answers as bitmasks over `options` (bit i = option i).
+    """
+    dtype = str(_bitmask_type(options)).replace("uint", "UInt")
+    filled = values.notna() & values.ne("")
+    choices = values[filled].str.split(";").explode().str.strip()
+    bits = choices.map({option: 1 << i for i, option in enumerate(options)}).fillna(0).astype("int64")
+    # Each option appears at most once per answer, so summing its bits equals OR-ing them.
+    masks = bits.groupby(level=0).sum().reindex(values.index)
+    return masks.astype(dtype).where(filled, pd.NA)
+
+
+def arrow_schema(columns, schema=None):
+    """
+    Fixed Arrow types for the archive, so every part file of every partition
+    agrees. `schema` is the question schema (default: the latest version).
+    """
+    schema = schema or get_schema()
+    fields = []
+    for column in columns:
+        question = schema.by_key.get(column)
+        if question is not None and question.widget == RADIO:
+            arrow_type = pa.dictionary(pa.int16(), pa.string())
+        elif question is not None and question.widget == MULTISELECT:
+            arrow_type = _bitmask_type(question.options)
+        elif question is not None and question.widget == DATE:
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column, arrow_type))
+    return pa.schema(fields + [pa.field(c, pa.string()) for c in PARTITION_COLUMNS])
+
+
+def encode_frame(df, schema=None):
+    """
+    Types a frame of raw (text) submissions for the archive.
+    """
+    schema = schema or get_schema()
+    out = {}
+    for column in df.columns:
+        values = df[column]
+        question = schema.by_key.get(column)
+        if question is None:
+            out[column] = values.astype("string")
+        elif question.widget == RADIO:
+            # Values outside the current options (older banks) are kept as extra categories.
+            extra = sorted(set(values.dropna()) - set(question.options))
+            out[column] = pd.Categorical(values, categories=list(question.options) + extra)
+        elif question.widget == MULTISELECT:
+            out[column] = _bitmask(values, question.options)
+        elif question.widget == DATE:
+            out[column] = parse_dates(values).dt.date
+        else:
+            out[column] = values.astype("string")
+
+    frame = pd.DataFrame(out, index=df.index)
+    frame["month"] = df["submission_timestamp"].str[:7].fillna("unknown")
+    frame["dairy_partner"] = df.get(PARTNER_KEY, pd.Series(index=df.index, dtype="object")).fillna(UNKNOWN_PARTNER)
+    return frame
+
+
+def expand_multiselect(df, schema=None):
+    """
+    Turns bitmask columns back into "; "-joined option text, as stored by the app.
+    """
+    schema = schema or get_schema()
+    df = df.copy()
+    for column in df.columns:
+        question = schema.by_key.get(column)
+        if question is None or question.widget != MULTISELECT:
+            continue
+        masks = df[column]
+        df[column] = [
+            None if pd.isna(mask) else "; ".join(o for i, o in enumerate(question.options) if int(mask) >> i & 1)
+            for mask in masks
+        ]
+    return df
+
+
+def _merge_partition(partition_dir):
+    """
+    Rewrites a partition's part files as a single file.
+    """
+    files = sorted(glob.glob(os.path.join(partition_dir, "*.parquet")))
+    if len(files) <= MAX_FILES_PER_PARTITION:
+        return
+    # Files written for older, narrower column sets are widened with nulls.
+    table = pa.concat_tables([pq.read_table(f, partitioning=None) for f in files], promote_options="permissive")
+    merged = os.path.join(partition_dir, f"merged-{uuid.uuid4().hex}.parquet")
+    pq.write_table(table, merged + ".tmp")
+    os.replace(merged + ".tmp", merged)
+    for f in files:
+        os.remove(f)
+
+
+def compact(store, archive_dir=ARCHIVE_DIR, chunk_size=50000, schema=None):
+    """
+    Appends submissions added since the last run to the archive, typed by
+    `schema` (default: the latest version when the run starts). Returns the
+    number of rows archived.
+    """
+    schema = schema or get_schema()
+    os.makedirs(archive_dir, exist_ok=True)
+    manifest = _read_manifest(archive_dir)
+    upto = store.last_rowid()
+    if upto <= manifest["watermark"]:
+        return 0
+
+    # Chunks are rowid ranges, so the watermark can be saved after each one
+    # and a run that stops part-way resumes after the last chunk it recorded.
+    # Part files are named after their range: a chunk written again after a
+    # crash replaces its earlier files instead of duplicating the rows.
+    archived, touched = 0, set()
+    start = manifest["watermark"]
+    while start < upto:
+        end = min(start + chunk_size, upto)
+        chunk = list(store.iter_rows(after_rowid=start, upto_rowid=end, chunk_size=chunk_size))
+        if chunk:
+            frame = encode_frame(pd.DataFrame.from_records(chunk, columns=store.columns), schema)
+            pq.write_to_dataset(
+                pa.Table.from_pandas(frame, schema=arrow_schema(store.columns, schema), preserve_index=False),
+                archive_dir,
+                partition_cols=PARTITION_COLUMNS,
+                basename_template=f"part-{start}-{end}-{{i}}.parquet",
+                # Partition directory names are URI-encoded ("Sunfresh%20Lactalis"); take them as written.
+                file_visitor=lambda written: touched.add(os.path.dirname(written.path)),
+            )
+            archived += len(frame)
+        manifest["watermark"] = end
+        manifest["rows"] += len(chunk)
+        _write_manifest(archive_dir, manifest)
+        start = end
+
+    for partition_dir in touched:
+        _merge_partition(partition_dir)
+    return archived
+
+
+def read_archive(archive_dir=ARCHIVE_DIR, columns=None, partners=None, months=None, filters=None):
+    """
+    Reads archived submissions as a DataFrame.
+
+    - `columns`: only these columns are read
+    - `partners` / `months`: prune partitions (months as "YYYY-MM")
+    - `filters`: extra pyarrow filters, e.g. [("submission_timestamp", ">=", "2025-01")]
+    """
+    predicates = list(filters or [])
+    if partners:
+        predicates.append(("dairy_partner", "in", list(partners)))
+    if months:
+        predicates.append(("month", "in", list(months)))
+    if columns is not None:
+        columns = list(columns)
+    return pd.read_parquet(
+        archive_dir, engine="pyarrow", columns=columns, filters=predicates or None,
+        ignore_prefixes=[MANIFEST, "."],
+    )
+
+
+def rebuild(store, archive_dir=ARCHIVE_DIR):
+    """
+    Drops the archive and rebuilds it from the store.
+    """
+    shutil.rmtree(archive_dir, ignore_errors=True)
+    return compact(store, archive_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compact TNS submissions into the partitioned Parquet archive.")
+    parser.add_argument("--db", default=DB_FILE, help="submission store to read")
+    parser.add_argument("--archive", default=ARCHIVE_DIR, help="archive directory")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the archive from scratch")
+    args = parser.parse_args(argv)
+
+    store = SQLiteSubmissionStore(args.db, get_schema().columns)
+    archived = (rebuild if args.rebuild else compact)(store, args.archive)
+    print(f"Archived {archived} submissions into {args.archive}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Benchmarks for the TNS self-assessment app.
+
+Drives the full wizard (consent, every section page, review, submit) through
+Streamlit's AppTest harness to time each rerun and measure per-session memory,
+then hammers the submission store with concurrent writers, both directly and
+through the submission queue, and checks that no row was lost, duplicated or
+misaligned. Results are printed (or written) as JSON so runs can
+be compared as the question bank grows.
+
+Usage:
+    python benchmarks/bench_app.py --sessions 3 --writers 16 --submissions 50 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import instrumentation  # noqa: E402
+from questions import RADIO, ROUTE_KEY, SCHEMA  # noqa: E402
+from submission_queue import SubmissionQueue  # noqa: E402
+from submission_store import SQLiteSubmissionStore  # noqa: E402
+
+APP_FILE = os.path.join(ROOT, "TNS-self-assessment.py")
+# Free-text answers that must pass the question bank's validation rules
+TEXT_ANSWERS = {
+    "Respondent and Location Details|Respondent Email ID": "benchmark@example.com",
+    "Respondent and Location Details|Respondent Contact Number": "9876543210",
+}
+# Session keys the app keeps between reruns (widget state is excluded)
+APP_STATE_KEYS = ["step", "page", "responses", "remarks_open", "draft_token", "draft_digests", "review_cache", "section_keys",
+                  "submission_id", "submission_timestamp"]
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    if not samples:
+        return {}
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+    return {
+        "count": len(samples), "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(pick(0.5), 3), "p90_ms": round(pick(0.9), 3),
+        "p99_ms": round(pick(0.99), 3), "max_ms": round(samples[-1], 3),
+    }
+
+
+def click(at, label):
+    button = next(b for b in at.button if label in b.label)
+    start = time.perf_counter()
+    button.click().run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(f"App raised after clicking {label!r}: {at.exception[0].message}")
+    return elapsed
+
+
+def run_session(timeout, trace_memory=False):
+    """
+    Walks one respondent through the whole survey. Returns per-step latencies (ms)
+    and the session's memory figures. Tracing allocations slows every rerun, so
+    latencies from a `trace_memory` run should not be reported.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    start = time.perf_counter()
+    at.run()
+    latencies = {"initial_load": [(time.perf_counter() - start) * 1000]}
+
+    at.text_input(key="signature-respondent").input("Benchmark")
+    latencies.setdefault("consent", []).append(click(at, "Start Survey"))
+
+    while 1 <= at.session_state.step <= len(SCHEMA.section_keys):
+        for text_input in at.text_input:
+            if not text_input.value:
+                text_input.input(TEXT_ANSWERS.get(text_input.key, "benchmark"))
+        step_name = f"section_{at.session_state.step}"
+        position = (at.session_state.step, at.session_state.page)
+        latencies.setdefault(step_name, []).append(click(at, "Next" if "Next" in " ".join(b.label for b in at.button) else "Review"))
+        if (at.session_state.step, at.session_state.page) == position:
+            raise RuntimeError(f"Stuck at step {position}: {[e.value for e in at.error]}")
+
+    # Measure the session at its largest: every answer held, review built
+    state = {key: at.session_state[key] for key in APP_STATE_KEYS if key in at.session_state}
+    responses_bytes = instrumentation.state_size({"responses": state.get("responses", {})})
+    session_bytes = instrumentation.state_size(state)
+
+    latencies.setdefault("review", []).append(click(at, "Submit Final"))
+    memory = {"session_state_bytes": session_bytes, "responses_bytes": responses_bytes}
+    if trace_memory:
+        memory["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return latencies, memory
+
+
+def bench_wizard(sessions, timeout):
+    latencies = {}
+    for _ in range(sessions):
+        session_latencies, _ = run_session(timeout)
+        for step, samples in session_latencies.items():
+            latencies.setdefault(step, []).extend(samples)
+    _, memory = run_session(timeout, trace_memory=True)
+    all_samples = [s for samples in latencies.values() for s in samples]
+    return {
+        "sessions": sessions,
+        "rerun_latency": percentiles(all_samples),
+        "per_step_latency": {step: percentiles(samples) for step, samples in latencies.items()},
+        "memory_per_session": memory,
+    }
+
+
+class CountingStore(SQLiteSubmissionStore):
+    """
+    Counts write transactions.
+    """
+    transactions = 0
+
+    def add_rows(self, rows, ignore_duplicates=False):
+        stored = super().add_rows(rows, ignore_duplicates)
+        self.transactions += 1
+        return stored
+
+
+def bench_concurrent_writes(writers, submissions_per_writer, queued=False):
+    """
+    N threads submit concurrently; each row carries its own id in a second
+    column so misaligned or lost rows are detected. With `queued`, submissions
+    go through the submission queue and every one is submitted twice, as a
+    double click would.
+    """
+    name = "bench_queued_writes" if queued else "bench_writes"
+    store = CountingStore(os.path.join(os.getcwd(), f"{name}.db"), SCHEMA.columns)
+    if queued:
+        queue = SubmissionQueue(os.path.join(os.getcwd(), f"{name}_queue.db"), lambda version: store)
+        queue.start()
+        submit = lambda submission: (queue.enqueue(submission, SCHEMA.version), queue.enqueue(submission, SCHEMA.version))
+    else:
+        submit = store.add
+    radios = [q for q in SCHEMA.questions if q.widget == RADIO]
+    latencies, errors = [], []
+    barrier = threading.Barrier(writers)
+
+    def writer(index):
+        barrier.wait()
+        for n in range(submissions_per_writer):
+            submission_id = str(uuid.uuid4())
+            submission = {"submission_id": submission_id, "submission_timestamp": f"{index}:{n}", ROUTE_KEY: submission_id}
+            for q in radios:
+                submission[q.full_key] = q.options[(index + n) % len(q.options)]
+            start = time.perf_counter()
+            try:
+                submit(submission)
+            except Exception as e:
+                errors.append(repr(e))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if queued:
+        while queue.pending():
+            time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+
+    expected = writers * submissions_per_writer
+    columns = ["submission_id", ROUTE_KEY]
+    rows = list(store.iter_rows(columns=columns))
+    ids = {row[0] for row in rows}
+    misaligned = sum(1 for row in rows if row[0] != row[1])
+    return {
+        "writers": writers,
+        "submissions": expected,
+        "stored": len(rows),
+        "lost": expected - len(ids),
+        "duplicates": len(rows) - len(ids),
+        "misaligned": misaligned,
+        "errors": errors[:10],
+        "store_transactions": store.transactions,
+        "throughput_per_s": round(expected / elapsed, 1),
+        "submit_latency": percentiles(latencies),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=3, help="full wizard runs to time")
+    parser.add_argument("--writers", type=int, default=16, help="concurrent submitters")
+    parser.add_argument("--submissions", type=int, default=50, help="submissions per submitter")
+    parser.add_argument("--timeout", type=float, default=60, help="AppTest timeout per rerun (s)")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)  # keep benchmark databases out of the working tree
+        try:
+            results = {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "questions": len(SCHEMA.questions),
+                "columns": len(SCHEMA.columns),
+                "wizard": bench_wizard(args.sessions, args.timeout),
+                "concurrent_writes": bench_concurrent_writes(args.writers, args.submissions),
+                "queued_writes": bench_concurrent_writes(args.writers, args.submissions, queued=True),
+            }
+        finally:
+            os.chdir(cwd)
+
+    ok = not any(
+        results[bench][k] for bench in ("concurrent_writes", "queued_writes") for k in ("lost", "duplicates", "misaligned")
+    )
+    results["ok"] = ok
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Durable drafts of in-progress assessments.
+
+Drafts are checkpointed per section, keyed by a resume token, so a restart or
+dropped connection only loses the page being filled. A background sweeper
+removes drafts that have not been touched for `DRAFT_TTL_SECONDS`.
+"""
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import date
+
+from questions import DATE
+
+DRAFTS_DB_FILE = "self_assessment_TNS_drafts.db"
+DRAFT_TTL_SECONDS = 14 * 24 * 3600
+
+
+def new_token():
+    return secrets.token_urlsafe(6)
+
+
+def encode_section(responses, section, schema):
+    """
+    Serialises one section's answers as JSON (dates as ISO strings).
+    """
+    values = {}
+    for key in schema.section_columns[section]:
+        value = responses.get(key)
+        if value in (None, "", []):
+            continue
+        values[key] = value.isoformat() if isinstance(value, date) else value
+    return json.dumps(values, sort_keys=True)
+
+
+def decode_sections(payloads, schema):
+    """
+    Rebuilds a responses dict from saved section payloads.
+    """
+    responses = {}
+    for payload in payloads.values():
+        responses.update(json.loads(payload))
+    for key, value in responses.items():
+        question = schema.by_key.get(key)
+        if question is not None and question.widget == DATE:
+            responses[key] = date.fromisoformat(value[:10])
+    return responses
+
+
+class DraftStore:
+    """
+    SQLite draft store in WAL mode: one metadata row per draft and one JSON row
+    per saved section.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS drafts (
+                    token TEXT PRIMARY KEY, respondent TEXT, step INTEGER, page INTEGER, updated_at REAL,
+                    question_bank_version TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_drafts_respondent ON drafts (respondent);
+                CREATE INDEX IF NOT EXISTS idx_drafts_updated_at ON drafts (updated_at);
+                CREATE TABLE IF NOT EXISTS draft_sections (
+                    token TEXT, section TEXT, payload TEXT, PRIMARY KEY (token, section)
+                );
+            """)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(drafts)")}
+            if "question_bank_version" not in existing:
+                conn.execute("ALTER TABLE drafts ADD COLUMN question_bank_version TEXT")
+        finally:
+            conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def save(self, token, respondent, version, step, page, sections):
+        """
+        Upserts the draft position and question bank version, and the given
+        sections (section -> JSON payload). Sections not passed are left untouched.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT INTO drafts (token, respondent, question_bank_version, step, page, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET respondent=excluded.respondent, "
+                "question_bank_version=excluded.question_bank_version, step=excluded.step, "
+                "page=excluded.page, updated_at=excluded.updated_at",
+                (token, respondent, version, step, page, time.time()),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO draft_sections (token, section, payload) VALUES (?, ?, ?)",
+                [(token, section, payload) for section, payload in sections.items()],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def load(self, token):
+        """
+        Returns (question bank version, step, page, payloads) for a draft, or
+        None if unknown. `payloads` maps section -> stored JSON (see
+        `decode_sections`) and seeds change detection.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT question_bank_version, step, page FROM drafts WHERE token = ?", (token,)
+            ).fetchone()
+            if row is None:
+                return None
+            payloads = dict(conn.execute(
+                "SELECT section, payload FROM draft_sections WHERE token = ?", (token,)
+            ).fetchall())
+        finally:
+            conn.close()
+        return row[0], row[1], row[2], payloads
+
+    def delete(self, token):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM draft_sections WHERE token = ?", (token,))
+            conn.execute("DELETE FROM drafts WHERE token = ?", (token,))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def expire(self, max_age_seconds=DRAFT_TTL_SECONDS):
+        """
+        Deletes drafts not updated within `max_age_seconds`. Returns how many were removed.
+        """
+        cutoff = time.time() - max_age_seconds
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM draft_sections WHERE token IN (SELECT token FROM drafts WHERE updated_at < ?)",
+                (cutoff,),
+            )
+            removed = conn.execute("DELETE FROM drafts WHERE updated_at < ?", (cutoff,)).rowcount
+            conn.execute("COMMIT")
+            return removed
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def start_sweeper(self, interval_seconds=3600, max_age_seconds=DRAFT_TTL_SECONDS):
+        """
+        Starts a daemon thread that expires old drafts every `interval_seconds`.
+        """
+        def sweep():
+            while True:
+                try:
+                    self.expire(max_age_seconds)
+                except sqlite3.Error:
+                    pass  # Retried on the next sweep
+                time.sleep(interval_seconds)
+
+        thread = threading.Thread(target=sweep, name="draft-sweeper", daemon=True)
+        thread.start()
+        return thread
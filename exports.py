@@ -0,0 +1,68 @@
+"""
+Compressed CSV snapshots of the submission store for download.
+
+Snapshots are streamed from the store in chunks into a gzip file on disk and
+reused by every session until a new submission arrives, so no page ever holds
+the full response history in memory.
+"""
+import csv
+import glob
+import gzip
+import hashlib
+import io
+import os
+import tempfile
+
+EXPORT_DIR = "exports"
+
+
+def snapshot_path(store, equals=None, since=None, until=None, export_dir=EXPORT_DIR):
+    """
+    Returns the snapshot file for the given filters at the store's current revision.
+    Submissions are only ever appended, so the highest rowid identifies the revision.
+    """
+    key = repr((store.last_rowid(), sorted((equals or {}).items()), since, until))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(export_dir, f"responses-{digest}.csv.gz")
+
+
+def build_snapshot(store, equals=None, since=None, until=None, export_dir=EXPORT_DIR):
+    """
+    Returns the path of a gzip CSV snapshot matching the filters, building it
+    only if no snapshot exists for the store's current revision.
+    """
+    path = snapshot_path(store, equals, since, until, export_dir)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(export_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=export_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+            with io.TextIOWrapper(gz, encoding="utf-8", newline="") as text:
+                writer = csv.writer(text)
+                writer.writerow(store.columns)
+                for row in store.iter_rows(equals=equals, since=since, until=until):
+                    writer.writerow(["" if v is None else v for v in row])
+        # Publish atomically; a concurrent build of the same snapshot simply wins the race.
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    _prune(export_dir, keep=path)
+    return path
+
+
+def _prune(export_dir, keep, max_files=20):
+    """
+    Removes the oldest snapshots so stale revisions do not accumulate on disk.
+    """
+    snapshots = sorted(glob.glob(os.path.join(export_dir, "responses-*.csv.gz")), key=os.path.getmtime)
+    for path in snapshots[:-max_files]:
+        if path != keep:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,215 @@
+"""
+Bulk ingestion of offline assessments (CSV or Excel) into the submission store.
+
+Column headers use the same `parent|label` keys as the app (see
+`QuestionSchema.columns` of the latest question bank, or of `--version`);
+consent fields use their bare label. Every cell is checked against the question schema and its
+validation rules (see `validation`) with vectorised pandas operations; rows
+without errors are written to the store and every invalid cell is listed in an
+error report. Dates may use any of `validation.DATE_FORMATS` (ISO, DD/MM/YYYY,
+DD-MM-YYYY) and are stored as ISO dates.
+
+`--legacy` imports the CSV the app appended to before the submission store
+(`self_assessment_TNS_responses.csv`); see `read_legacy_csv()`.
+
+Usage:
+    python ingest.py sheet1.xlsx sheet2.csv --db self_assessment_TNS_responses.db
+    python ingest.py --legacy self_assessment_TNS_responses.csv
+"""
+import argparse
+import csv
+import functools
+import os
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import validation
+from questions import DATE, MULTISELECT, RADIO, get_schema
+from submission_store import DB_FILE, LEGACY_BANK_VERSION, META_COLUMNS, SQLiteSubmissionStore
+
+ERROR_COLUMNS = ["file", "row", "column", "value", "error"]
+
+
+def read_sheet(path):
+    """
+    Reads a CSV or Excel file with every cell as a (possibly empty) string.
+    """
+    if path.lower().endswith((".xlsx", ".xls")):
+        try:
+            df = pd.read_excel(path, dtype=str)
+        except ImportError as e:
+            raise SystemExit(f"Reading Excel files needs openpyxl ({e}). Install it or export the sheet to CSV.")
+    else:
+        # The pyarrow parser is multi-threaded; the default one dominated large loads.
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, engine="pyarrow")
+    df.columns = [str(c).strip() for c in df.columns]
+    return df.fillna("").apply(lambda col: col.str.strip())
+
+
+def read_legacy_csv(path):
+    """
+    Reads the app's former append-only CSV. Its header was written from the
+    first submission only and blank answers were dropped, so later rows can
+    have a different number of cells; those rows cannot be realigned and are
+    returned as errors. Rows of the right length written under another column
+    order fail the option checks in `validate_frame()` instead.
+    Returns (frame indexed by data row number, error frame).
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [c.strip() for c in next(reader, [])]
+        rows, index, bad = [], [], []
+        for number, row in enumerate(reader):
+            if len(row) == len(header):
+                rows.append([cell.strip() for cell in row])
+                index.append(number)
+            else:
+                bad.append((number, len(row)))
+    df = pd.DataFrame(rows, columns=header, index=index)
+    if "question_bank_version" not in df.columns:
+        df["question_bank_version"] = LEGACY_BANK_VERSION
+    errors = pd.DataFrame({
+        "row": [number for number, _ in bad], "column": "",
+        "value": [f"{cells} cells, header has {len(header)}" for _, cells in bad],
+        "error": "row does not match the header (written with a different column set)",
+    }, columns=["row", "column", "value", "error"])
+    return df, errors
+
+
+def validate_frame(df, schema=None):
+    """
+    Validates all rows at once against `schema` (default: the latest version).
+    Returns (normalised frame, error frame) where the error frame has one row
+    per invalid cell (`row` is the frame index).
+    """
+    schema = schema or get_schema()
+    df = df.copy()
+    errors = []
+
+    def flag(mask, column, message):
+        if mask.any():
+            errors.append(pd.DataFrame({
+                "row": df.index[mask], "column": column,
+                "value": df.loc[mask, column], "error": message,
+            }))
+
+    for column in df.columns:
+        if column not in schema.columns and column not in META_COLUMNS:
+            flag(df[column].ne(""), column, "unknown column")
+
+    if "submission_id" in df.columns:
+        ids = df["submission_id"]
+        flag(ids.ne("") & ids.duplicated(), "submission_id", "repeats the submission_id of an earlier row")
+
+    for question in schema.questions:
+        column = question.full_key
+        if column not in df.columns:
+            continue
+        values = df[column]
+        filled = values.ne("")
+
+        if question.widget == RADIO:
+            flag(filled & ~values.isin(question.options), column, "not one of the allowed options")
+        elif question.widget == MULTISELECT:
+            choices = values[filled].str.split(";").explode().str.strip()
+            bad_rows = (~choices.isin(question.options)).groupby(level=0).any()
+            flag(filled & bad_rows.reindex(df.index, fill_value=False), column, "contains an option that is not allowed")
+        elif question.widget == DATE:
+            parsed = validation.parse_dates(values)
+            flag(filled & parsed.isna(), column, "not a valid date")
+            df[column] = parsed.dt.strftime("%Y-%m-%d").where(filled, "")
+
+    # Email/phone formats, date plausibility, exclusive options, ...
+    errors.append(validation.validate_frame(df, schema))
+    error_frame = pd.concat(errors, ignore_index=True)
+    return df, error_frame
+
+
+def load_file(path, legacy=False, version=None):
+    """
+    Reads and validates one file against bank `version` (default: the latest).
+    Runs in a worker process for multi-file batches.
+    """
+    if legacy:
+        df, unreadable = read_legacy_csv(path)
+    else:
+        df, unreadable = read_sheet(path), pd.DataFrame(columns=["row", "column", "value", "error"])
+    df, errors = validate_frame(df, get_schema(version))
+    valid = df.drop(index=errors["row"].unique())
+    errors = pd.concat([unreadable, errors], ignore_index=True)
+    errors.insert(0, "file", path)
+    # Report spreadsheet row numbers (header is row 1)
+    errors["row"] = errors["row"] + 2
+    return path, len(df) + len(unreadable), valid, errors
+
+
+def to_rows(df, columns, version):
+    """
+    Converts validated rows to store rows in `columns` order, generating ids
+    and timestamps for rows that do not carry them and recording `version` for
+    rows without a question bank version. Cells are taken from each
+    column's distinct values, so a repeated option is one shared string rather
+    than one object per cell.
+    """
+    df = df.reindex(columns=columns, fill_value="")
+    missing_id = df["submission_id"].eq("")
+    df.loc[missing_id, "submission_id"] = [str(uuid.uuid4()) for _ in range(missing_id.sum())]
+    df.loc[df["submission_timestamp"].eq(""), "submission_timestamp"] = datetime.now().isoformat()
+    df.loc[df["question_bank_version"].eq(""), "question_bank_version"] = version
+    values = np.empty((len(df), len(columns)), dtype=object)
+    for i, column in enumerate(columns):
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        uniques = np.asarray(uniques, dtype=object)
+        uniques[pd.isna(uniques) | (uniques == "")] = None
+        values[:, i] = uniques[codes]
+    return values.tolist()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load offline TNS self-assessments into the submission store.")
+    parser.add_argument("files", nargs="+", help="CSV or Excel files with one assessment per row")
+    parser.add_argument("--db", default=DB_FILE, help="submission store to write to")
+    parser.add_argument("--errors", default="ingest_errors.csv", help="where to write the invalid-cell report")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes used for multi-file batches")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, do not write to the store")
+    parser.add_argument("--legacy", action="store_true",
+                        help="the files are the app's former self_assessment_TNS_responses.csv")
+    parser.add_argument("--version", help="question bank version to validate against (default: the latest)")
+    args = parser.parse_args(argv)
+
+    # Resolved when the load runs, so a bank version published since the last load is used.
+    schema = get_schema(args.version)
+    load = functools.partial(load_file, legacy=args.legacy, version=schema.version)
+    if len(args.files) > 1 and args.workers > 1:
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(args.files))) as pool:
+            results = list(pool.map(load, args.files))
+    else:
+        results = [load(path) for path in args.files]
+
+    store = None if args.dry_run else SQLiteSubmissionStore(args.db, schema.columns)
+    all_errors = []
+    for path, total, valid, errors in results:
+        summary = f"{path}: {total} rows, {len(valid)} valid, {total - len(valid)} rejected"
+        # A single writer process keeps inserts serialised through the store's lock.
+        if store is not None and len(valid):
+            # Ids already stored (e.g. a sheet loaded twice) are skipped instead of failing the load.
+            stored = store.add_rows(to_rows(valid, store.columns, schema.version), ignore_duplicates=True)
+            if stored < len(valid):
+                summary += f", {len(valid) - stored} already stored"
+        all_errors.append(errors)
+        print(summary)
+
+    error_report = pd.concat(all_errors, ignore_index=True)
+    if len(error_report):
+        error_report[ERROR_COLUMNS].to_csv(args.errors, index=False)
+        print(f"{len(error_report)} invalid cells written to {args.errors}")
+    return 1 if len(error_report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Lightweight timing of the app's hot paths.
+
+Enabled with the TNS_PROFILE=1 environment variable. When disabled, `timed()`
+returns a shared no-op context manager and `instrumented()` returns the
+function unchanged, so the overhead is a single flag check.
+
+Records are kept in a bounded in-process buffer (for the admin Performance
+page) and written as JSON lines to the "tns.perf" logger; set TNS_PROFILE_LOG
+to a file path to have them written there.
+"""
+import contextlib
+import functools
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+ENABLED = os.environ.get("TNS_PROFILE") == "1"
+MAX_RECORDS = 10000
+
+logger = logging.getLogger("tns.perf")
+if ENABLED and os.environ.get("TNS_PROFILE_LOG"):
+    _handler = logging.FileHandler(os.environ["TNS_PROFILE_LOG"])
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+_records = deque(maxlen=MAX_RECORDS)
+_lock = threading.Lock()
+_NULL = contextlib.nullcontext()
+
+
+def record(phase, seconds, **fields):
+    entry = {"ts": time.time(), "phase": phase, "ms": round(seconds * 1000, 3), **fields}
+    with _lock:
+        _records.append(entry)
+    logger.info(json.dumps(entry, default=str))
+
+
+@contextlib.contextmanager
+def _timer(phase, fields):
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        record(phase, time.perf_counter() - start, **fields)
+
+
+def timed(phase, **fields):
+    """
+    Context manager timing a block. The yielded dict can be filled with extra
+    fields (e.g. widget counts) before the block ends.
+    """
+    if not ENABLED:
+        return _NULL
+    return _timer(phase, fields)
+
+
+def instrumented(phase):
+    """
+    Decorator timing every call of a function under `phase`.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _timer(phase, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def state_size(state):
+    """
+    Approximate size in bytes of a session's state (pickled size of its picklable values).
+    """
+    size = 0
+    for value in state.values():
+        try:
+            size += len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            pass
+    return size
+
+
+def records():
+    with _lock:
+        return list(_records)
+
+
+def summary():
+    """
+    Per-phase count and latency percentiles (ms) over the buffered records.
+    """
+    df = pd.DataFrame(records())
+    if df.empty:
+        return df
+    stats = df.groupby("phase")["ms"].describe(percentiles=[0.5, 0.9, 0.99])
+    return stats[["count", "50%", "90%", "99%", "max"]].rename(
+        columns={"50%": "p50 ms", "90%": "p90 ms", "99%": "p99 ms", "max": "max ms"}
+    ).sort_values("p90 ms", ascending=False)
@@ -0,0 +1,59 @@
+import os
+
+import streamlit as st
+
+from admin import require_admin
+from questions import get_schema
+from scoring import GROUP_KEYS, GROUP_NAMES, ScoreAggregator
+from submission_store import DB_FILE, LEGACY_CSV_FILE, SQLiteSubmissionStore
+
+# --- Streamlit Page Configuration ---
+st.set_page_config(page_title="Project Ksheersagar – TNS Admin Dashboard", layout="wide")
+
+st.title("TNS Self-Assessment – Maturity Dashboard")
+require_admin()
+
+if os.path.exists(LEGACY_CSV_FILE):
+    st.warning(f"`{LEGACY_CSV_FILE}` holds responses saved before the submission store and they are not scored. "
+               f"Import them with `python ingest.py --legacy {LEGACY_CSV_FILE}`, then move the file away.")
+
+# --- Data Loading ---
+@st.cache_resource
+def get_aggregator():
+    """
+    One aggregator shared by all sessions; each page load only folds in new
+    submissions, scoring each with its own question bank version.
+    """
+    return ScoreAggregator(SQLiteSubmissionStore(DB_FILE, get_schema().columns))
+
+aggregator = get_aggregator()
+aggregator.refresh()
+
+if aggregator.submissions == 0:
+    st.info("No submissions yet.")
+    st.stop()
+
+st.metric("Submissions scored", aggregator.submissions)
+st.caption("Scores are 0–100%: each option's level follows its order in the question bank; "
+           "'None of the above' and 'Not aware' score 0.")
+
+# --- Section Scores ---
+group_by = st.radio("Group by", GROUP_KEYS, format_func=GROUP_NAMES.get, horizontal=True)
+
+st.subheader("Overall")
+st.dataframe((aggregator.section_scores(by=None) * 100).round(1), use_container_width=True)
+
+st.subheader(f"Section scores by {GROUP_NAMES[group_by]}")
+section_scores = aggregator.section_scores(by=group_by).rename(index={"": "(not given)"})
+section_scores.index.name = GROUP_NAMES[group_by]
+st.dataframe((section_scores * 100).round(1), use_container_width=True)
+st.bar_chart(section_scores * 100)
+
+# --- Question Scores ---
+st.subheader("Question scores")
+question_scores = aggregator.question_scores(by=group_by).rename(index={"": "(not given)"})
+selected = st.selectbox(GROUP_NAMES[group_by], list(question_scores.index))
+detail = (question_scores.loc[selected] * 100).round(1).to_frame("Score (%)")
+detail.insert(0, "Section", [aggregator.questions[k].section for k in detail.index])
+detail.index = [aggregator.questions[k].label for k in detail.index]
+st.dataframe(detail, use_container_width=True)
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import streamlit as st
+
+import instrumentation
+from admin import require_admin
+from submission_queue import QUEUE_DB_FILE, SubmissionQueue
+
+# --- Streamlit Page Configuration ---
+st.set_page_config(page_title="Project Ksheersagar – TNS Performance", layout="wide")
+
+st.title("TNS Self-Assessment – Performance")
+require_admin()
+
+@st.cache_resource
+def get_spool():
+    """
+    The app's submission spool, for status only; the app's background writer drains it.
+    """
+    return SubmissionQueue(QUEUE_DB_FILE)
+
+def format_times(rows, *keys):
+    return [{**row, **{k: datetime.fromtimestamp(row[k]).isoformat(" ", "seconds") for k in keys}} for row in rows]
+
+# --- Submission Queue ---
+st.subheader("Submission queue")
+spool = get_spool()
+failing, dead = spool.failing(), spool.dead_letters()
+q1, q2, q3 = st.columns(3)
+q1.metric("Waiting to be saved", spool.pending())
+q2.metric("Failing", len(failing))
+q3.metric("Dead letters", len(dead))
+if failing:
+    st.warning(f"Latest write error: {failing[-1]['last_error']}")
+    st.dataframe(format_times(failing, "enqueued_at"), use_container_width=True)
+if dead:
+    st.error(f"{len(dead)} submission(s) could not be saved and are kept in the dead letters of `{QUEUE_DB_FILE}`. "
+             "Fix the cause (see the errors below and the server log), then retry them.")
+    st.dataframe(format_times(dead, "enqueued_at", "failed_at"), use_container_width=True)
+    if st.button("Retry dead letters"):
+        st.success(f"{spool.requeue_dead_letters()} submission(s) queued again.")
+
+# --- Timings ---
+if not instrumentation.ENABLED:
+    st.info("Instrumentation is off. Start the app with TNS_PROFILE=1 to record timings.")
+    st.stop()
+
+records = instrumentation.records()
+st.caption(f"{len(records)} most recent timings in this server process (max {instrumentation.MAX_RECORDS}).")
+if not records:
+    st.stop()
+
+st.subheader("Latency by phase")
+st.dataframe(instrumentation.summary().round(2), use_container_width=True)
+
+st.subheader("Recent script runs")
+runs = [r for r in records if r["phase"] == "rerun"][-200:]
+if runs:
+    st.dataframe(runs[::-1], use_container_width=True)
+
+if st.button("Refresh"):
+    st.rerun()
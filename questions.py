@@ -0,0 +1,327 @@
+"""
+Survey question bank and its compiled schema.
+
+Question banks are versioned JSON files in `question_bank/` (`<version>.json`
+holding {"version": ..., "questions": {nested sections}, "rules": [...]};
+`null` marks a free-text question and "rules" are the version's validation
+rules, see `validation`). Each version is loaded once per process into an
+immutable, string-interned structure and compiled into a `QuestionSchema`:
+a flat, ordered list of question records plus a per-section render layout,
+so the app never walks the nested dict per rerun. All sessions share the same
+compiled objects.
+
+New bank versions are picked up without a restart: the directory is
+re-scanned at most every `RELOAD_INTERVAL_SECONDS`. A version is immutable once
+loaded (later edits to its file are logged and ignored), so changes to the
+questions are published as a new version file. A file that fails to load is
+logged and skipped, and the versions loaded before it keep being served.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from instrumentation import timed
+from validation import compile_rules
+
+QUESTION_BANK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "question_bank")
+RELOAD_INTERVAL_SECONDS = 5.0
+
+logger = logging.getLogger("tns.questions")
+
+# Fields collected on the consent step; stored under their bare label and rendered without remarks.
+CONSENT_KEYS = frozenset([
+    "Consent to fill the form", "Signature of the respondent",
+    "Reviewed and confirmed by Route Incharge", "Signature of Route In charge",
+    "Reviewed and confirmed by Ksheersagar SPOC", "Signature of SPOC"
+])
+
+# Pseudo-section holding the consent fields, which are collected on their own step
+CONSENT_SECTION = "Consent"
+
+# Columns used to slice submissions by partner and location
+PARTNER_KEY = "Respondent and Location Details|Name of the Dairy Partner"
+BMC_CODE_KEY = "Respondent and Location Details|BMC/ MCC code"
+ROUTE_KEY = "Respondent and Location Details|Route Number"
+RESPONSE_DATE_KEY = "Respondent and Location Details|Date of response"
+
+# Columns identifying the respondent
+EMAIL_KEY = "Respondent and Location Details|Respondent Email ID"
+CONTACT_KEY = "Respondent and Location Details|Respondent Contact Number"
+
+# Widget types
+RADIO = "radio"
+MULTISELECT = "multiselect"
+DATE = "date"
+TEXT = "text"
+
+
+def get_full_key(parent_key, question_label):
+    return f"{parent_key}|{question_label}"
+
+
+class Question:
+    """
+    One compiled question. Consent questions are keyed by their bare label and
+    have no remarks column.
+    """
+    __slots__ = ("full_key", "label", "section", "widget", "options", "option_index", "remarks_key")
+
+    def __init__(self, full_key, label, section, widget, options, remarks_key):
+        self.full_key = full_key
+        self.label = label
+        self.section = section
+        self.widget = widget
+        self.options = options
+        self.option_index = {option: i for i, option in enumerate(options)}
+        self.remarks_key = remarks_key
+
+    def __repr__(self):
+        return f"Question({self.full_key!r}, {self.widget})"
+
+
+class Group:
+    """
+    Layout marker for a nested sub-dict: rendered as a heading when opened and
+    a divider when closed.
+    """
+    __slots__ = ("label", "closing")
+
+    def __init__(self, label, closing=False):
+        self.label = label
+        self.closing = closing
+
+
+class QuestionSchema:
+    """
+    The compiled question bank.
+
+    - `version`: question bank version it was compiled from
+    - `data`: the immutable nested question definitions
+    - `questions`: every question, in canonical order
+    - `by_key`: full key -> question
+    - `section_keys`: section names, in order
+    - `layout`: section -> tuple of `Question`/`Group` items to render
+    - `pages`: section -> tuple of pages, each a slice of the layout split at
+      the section's top-level sub-dicts
+    - `columns`: canonical response column order (answers and remarks)
+    - `section_columns`: section (or `CONSENT_SECTION`) -> its response columns
+    - `rules`: column -> compiled validation rules
+    - `record_slots`: choice/date question key -> (section, position) in the
+      section's compact answer record (see `session_responses`)
+    """
+    __slots__ = (
+        "version", "data", "questions", "by_key", "section_keys", "layout", "pages", "columns", "section_columns",
+        "rules", "record_slots"
+    )
+
+    def __init__(self, questions_data, version=None, rules=()):
+        self.version = version
+        self.data = questions_data
+        questions, layout = [], {}
+        for section, section_data in questions_data.items():
+            items = []
+            _compile(section_data, section, section, questions, items)
+            layout[section] = tuple(items)
+
+        self.questions = tuple(questions)
+        self.by_key = {q.full_key: q for q in questions}
+        self.section_keys = tuple(questions_data)
+        self.layout = layout
+        self.pages = {section: _paginate(items) for section, items in layout.items()}
+        self.columns = tuple(
+            column
+            for q in questions
+            for column in ((q.full_key,) if q.remarks_key is None else (q.full_key, q.remarks_key))
+        )
+        section_columns = {}
+        for q in questions:
+            if q.remarks_key is None:
+                section_columns.setdefault(CONSENT_SECTION, []).append(q.full_key)
+            else:
+                section_columns.setdefault(q.section, []).extend([q.full_key, q.remarks_key])
+        self.section_columns = {section: tuple(columns) for section, columns in section_columns.items()}
+        self.record_slots = {}
+        for section, columns in self.section_columns.items():
+            coded = [c for c in columns if c in self.by_key and self.by_key[c].widget != TEXT]
+            self.record_slots.update((column, (section, i)) for i, column in enumerate(coded))
+        self.rules = compile_rules(rules, self)
+
+
+def _compile(questions_data, parent_key, section, questions, items):
+    for label, value in questions_data.items():
+        full_key = get_full_key(parent_key, label)
+
+        if isinstance(value, Mapping):
+            items.append(Group(label))
+            _compile(value, full_key, section, questions, items)
+            items.append(Group(label, closing=True))
+            continue
+
+        if isinstance(value, (list, tuple)):
+            widget = MULTISELECT if "multiple options" in label else RADIO
+        else:
+            widget = DATE if "Date" in label else TEXT
+        options = tuple(value or ())
+
+        if label in CONSENT_KEYS:
+            questions.append(Question(label, label, section, widget, options, None))
+        else:
+            question = Question(full_key, label, section, widget, options, f"{full_key}|Remarks")
+            questions.append(question)
+            items.append(question)
+
+
+def _paginate(items):
+    """
+    Splits a section layout into pages: each top-level group is one page and
+    consecutive top-level questions share a page.
+    """
+    pages, current, depth = [], [], 0
+    for item in items:
+        if isinstance(item, Group) and not item.closing:
+            if depth == 0 and current:
+                pages.append(tuple(current))
+                current = []
+            depth += 1
+        current.append(item)
+        if isinstance(item, Group) and item.closing:
+            depth -= 1
+            if depth == 0:
+                pages.append(tuple(current))
+                current = []
+    if current:
+        pages.append(tuple(current))
+    return tuple(pages) or ((),)
+
+
+def _freeze(value):
+    """
+    Converts parsed JSON into read-only mappings and tuples of interned strings.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(sys.intern(v) for v in value)
+    return value
+
+
+def _version_key(version):
+    return tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in version.split("."))
+
+
+class _QuestionBankCache:
+    """
+    Process-wide cache of compiled schemas, one per bank version.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._files = {}  # version -> (path, mtime)
+        self._schemas = {}  # version -> (mtime, schema)
+        self._reported = {}  # version -> mtime of a file state already logged as unloadable or ignored
+        self._scanned_at = None
+
+    def _scan(self):
+        now = time.monotonic()
+        if self._scanned_at is not None and now - self._scanned_at < RELOAD_INTERVAL_SECONDS:
+            return
+        files = {}
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                files[name[:-len(".json")]] = (path, os.path.getmtime(path))
+        self._files = files
+        self._scanned_at = now
+
+    def _load(self, version, path):
+        with timed("get_questions", version=version):
+            with open(path, encoding="utf-8") as f:
+                bank = json.load(f)
+            if str(bank.get("version", version)) != version:
+                raise ValueError(f"{path} declares version {bank['version']!r}, expected {version!r}")
+            return QuestionSchema(_freeze(bank["questions"]), version=sys.intern(version), rules=bank.get("rules", ()))
+
+    def _compiled(self, version):
+        """
+        The schema of `version`, compiled on first use, or None if its file
+        cannot be loaded. Called with the lock held.
+        """
+        path, mtime = self._files.get(version, (None, None))
+        cached = self._schemas.get(version)
+        if cached is not None:
+            # Stores, translations and sessions are cached per version string,
+            # so a loaded version never changes; edits must go in a new file.
+            if path is not None and mtime != cached[0] and self._reported.get(version) != mtime:
+                self._reported[version] = mtime
+                logger.warning("%s changed after version %s was loaded; the change is ignored. "
+                               "Save edits to a published question bank as a new version file.", path, version)
+            return cached[1]
+        if path is None or self._reported.get(version) == mtime:
+            return None
+        try:
+            schema = self._load(version, path)
+        except Exception:
+            # Logged once per file state; other versions keep being served.
+            self._reported[version] = mtime
+            logger.exception("Could not load question bank %s; it is skipped until the file is fixed", path)
+            return None
+        self._schemas[version] = (mtime, schema)
+        return schema
+
+    def versions(self):
+        with self._lock:
+            self._scan()
+            known = set(self._files) | set(self._schemas)
+            return sorted((v for v in known if self._compiled(v) is not None), key=_version_key)
+
+    def get(self, version=None):
+        with self._lock:
+            self._scan()
+            if version is None:
+                # The newest version that loads; a broken new file leaves the previous one in use.
+                for candidate in sorted(self._files, key=_version_key, reverse=True):
+                    schema = self._compiled(candidate)
+                    if schema is not None:
+                        return schema
+                raise FileNotFoundError(f"No loadable question bank files in {self.directory}")
+            schema = self._compiled(version)
+            if schema is None:
+                raise KeyError(f"Unknown or unloadable question bank version {version!r}")
+            return schema
+
+
+_cache = _QuestionBankCache(QUESTION_BANK_DIR)
+
+
+def get_schema(version=None):
+    """
+    Returns the compiled schema for a bank version (default: the latest).
+    """
+    return _cache.get(version)
+
+
+def available_versions():
+    """
+    Bank versions on disk or still cached for sessions that use them, oldest first.
+    """
+    return _cache.versions()
+
+
+def get_questions(version=None):
+    """
+    Returns the nested, read-only question definitions for a bank version.
+    """
+    return get_schema(version).data
+
+
+# Schema at import time, for one-off scripts (e.g. benchmarks). Long-running
+# code (the app, its pages, scoring, ingest, archive) calls get_schema() when
+# it runs, so a hot-reloaded version is picked up without a restart.
+SCHEMA = get_schema()
+QUESTIONS = SCHEMA.data
@@ -0,0 +1,65 @@
+"""
+Per-section review summaries for the final review step.
+
+A summary is built once per section and reused until that section's answers
+change, so re-reading the review page does not re-format every response.
+"""
+import pandas as pd
+
+from questions import CONSENT_SECTION
+
+
+def format_value(value):
+    """
+    Formats a response the way it is stored: lists joined with "; ", everything else as text.
+    """
+    return "; ".join(map(str, value)) if isinstance(value, list) else str(value)
+
+
+class SectionSummary:
+    """
+    Review data for one section:
+    - `values`: column -> stored text, for answered columns only
+    - `table`: Question/Response frame for display, in the localization's language
+    - `answered` / `unanswered`: question counts (remarks are not counted)
+    """
+    __slots__ = ("section", "values", "table", "answered", "unanswered")
+
+    def __init__(self, section, responses, schema, localization):
+        self.section = section
+        self.values = {}
+        labels, shown = [], []
+        answered = total = 0
+        for column in schema.section_columns[section]:
+            question = schema.by_key.get(column)
+            if question is not None:
+                total += 1
+            value = responses.get(column)
+            if value in [None, "", []]:
+                continue
+            self.values[column] = format_value(value)
+            labels.append(localization.labels[column] if question is not None else localization.ui["Remarks"])
+            shown.append(localization.display(column, self.values[column]))
+            answered += question is not None
+
+        self.answered = answered
+        self.unanswered = total - answered
+        self.table = pd.DataFrame({localization.ui["Question"]: labels, localization.ui["Response"]: shown})
+
+
+def review_sections(schema):
+    """
+    Sections in review order: consent first, then the survey sections.
+    """
+    return (CONSENT_SECTION,) + schema.section_keys
+
+
+def get_summary(cache, section, responses, schema, localization):
+    """
+    Returns the cached summary for `section`, building it if it was invalidated.
+    The cache must be cleared when the language changes.
+    """
+    summary = cache.get(section)
+    if summary is None:
+        summary = cache[section] = SectionSummary(section, responses, schema, localization)
+    return summary
@@ -0,0 +1,218 @@
+"""
+Maturity scoring of submissions.
+
+Each graded option's level comes from its position in `get_questions()`:
+"a." is level 1, "b." level 2, and so on. "None of the above" and "Not aware"
+score 0. Multi-select questions score the number of graded practices
+selected. Scores are normalised to 0-1 by the question's highest level.
+
+`ScoreAggregator` keeps per-group sums and counts and folds in only the
+submissions added since its last refresh, so dashboards never rescan the
+whole history. A revision (a submission that `supersedes` an earlier one)
+takes the place of the submission it replaces. Each submission is scored with
+the question bank version it was made with, so questions added by a
+hot-reloaded version are scored without a restart.
+"""
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from questions import BMC_CODE_KEY, MULTISELECT, PARTNER_KEY, RADIO, ROUTE_KEY, available_versions, get_schema
+
+# Sections that describe the respondent rather than maturity
+UNSCORED_SECTIONS = {"Respondent and Location Details"}
+
+GROUP_KEYS = [PARTNER_KEY, BMC_CODE_KEY, ROUTE_KEY]
+GROUP_NAMES = {PARTNER_KEY: "Dairy Partner", BMC_CODE_KEY: "BMC/ MCC code", ROUTE_KEY: "Route Number"}
+
+_OPTION_PREFIX = re.compile(r"^[a-z]\.\s*")
+_ZERO_LEVEL_OPTIONS = {"None of the above", "Not aware"}
+
+
+def _option_levels(options):
+    """
+    Returns (option -> level, highest level) for an ordered option list.
+    """
+    levels, level = {}, 0
+    for option in options:
+        if _OPTION_PREFIX.sub("", option).strip() in _ZERO_LEVEL_OPTIONS:
+            levels[option] = 0
+        else:
+            level += 1
+            levels[option] = level
+    return levels, level
+
+
+class ScoredQuestion:
+    __slots__ = ("question", "levels", "max_level", "graded")
+
+    def __init__(self, question):
+        self.question = question
+        self.levels, self.max_level = _option_levels(question.options)
+        self.graded = [option for option, level in self.levels.items() if level > 0]
+
+
+_scored_by_version = {}
+
+
+def scored_questions(schema):
+    """
+    The `ScoredQuestion`s of a schema, built once per bank version (a loaded
+    version never changes).
+    """
+    scored = _scored_by_version.get(schema.version)
+    if scored is None:
+        scored = _scored_by_version[schema.version] = [
+            ScoredQuestion(q) for q in schema.questions
+            if q.section not in UNSCORED_SECTIONS and q.widget in (RADIO, MULTISELECT)
+        ]
+    return scored
+
+
+def _schema_for(version):
+    """
+    The schema a stored submission was made with; the latest one when its
+    version is missing or no longer loadable.
+    """
+    try:
+        return get_schema(version or None)
+    except KeyError:
+        return get_schema()
+
+
+def score_frame(df, schema=None):
+    """
+    Maps a frame of raw submissions to normalised scores (0-1, NaN when
+    unanswered or unrecognised), one column per scored question of `schema`
+    (default: the latest version).
+    """
+    scores = {}
+    for sq in scored_questions(schema or get_schema()):
+        key = sq.question.full_key
+        if key not in df.columns:
+            scores[key] = np.nan
+            continue
+        values = df[key]
+        if sq.question.widget == MULTISELECT:
+            choices = values.dropna().str.split(";").explode().str.strip()
+            level = choices.isin(sq.graded).groupby(level=0).sum().reindex(df.index)
+            # A blank multi-select answer is unanswered, not zero.
+            level[values.isna() | values.eq("")] = np.nan
+            scores[key] = level / sq.max_level
+        else:
+            scores[key] = values.map(sq.levels) / sq.max_level
+    return pd.DataFrame(scores, index=df.index, dtype="float64")
+
+
+class ScoreAggregator:
+    """
+    Running per-(partner, BMC/MCC, route) sums and answer counts of question
+    scores. `refresh()` reads only rows added since the previous call.
+    `questions` maps every scored column folded so far to its question, in
+    the order the columns were first seen.
+    """
+
+    def __init__(self, store, chunk_size=5000):
+        self.store = store
+        self.chunk_size = chunk_size
+        self.watermark = 0
+        self.submissions = 0
+        self.replaced_by = {}  # Replaced submission id -> id of the revision that replaced it
+        self.questions = {}
+        self.sums = pd.DataFrame(dtype="float64")
+        self.counts = pd.DataFrame(dtype="float64")
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        with self._lock:
+            upto = self.store.last_rowid()
+            if upto <= self.watermark:
+                return
+            # Scored columns of every known version, as far as the store has them
+            stored = set(self.store.stored_columns())
+            scored = dict.fromkeys(
+                sq.question.full_key for version in available_versions()
+                for sq in scored_questions(get_schema(version))
+            )
+            columns = GROUP_KEYS + ["submission_id", "supersedes", "question_bank_version"] + [
+                k for k in scored if k in stored
+            ]
+            rows = self.store.iter_rows(
+                columns=columns, after_rowid=self.watermark, upto_rowid=upto, chunk_size=self.chunk_size
+            )
+            while True:
+                chunk = [row for _, row in zip(range(self.chunk_size), rows)]
+                if not chunk:
+                    break
+                df = pd.DataFrame.from_records(chunk, columns=columns)
+                self._fold(df)
+                # Replaced submissions were folded earlier (they have lower rowids); take them out again.
+                replaced = [
+                    row for submission_id in self._replaced(df)
+                    for row in self.store.iter_rows(equals={"submission_id": submission_id}, columns=columns)
+                ]
+                if replaced:
+                    self._fold(pd.DataFrame.from_records(replaced, columns=columns), sign=-1)
+            self.watermark = upto
+
+    def _replaced(self, df):
+        """
+        Records the revisions in `df` and returns the ids they replace. A
+        revision of an already replaced submission replaces the latest revision
+        instead, so each one is subtracted once (as `SubmissionIndex` links them).
+        """
+        replaced = []
+        for submission_id, supersedes in zip(df["submission_id"], df["supersedes"]):
+            if pd.isna(supersedes) or not supersedes:
+                continue
+            head, seen = supersedes, set()
+            while head in self.replaced_by and head not in seen:
+                seen.add(head)
+                head = self.replaced_by[head]
+            if head != submission_id:
+                self.replaced_by[head] = submission_id
+                replaced.append(head)
+        return replaced
+
+    def _fold(self, df, sign=1):
+        for version, part in df.groupby(df["question_bank_version"].fillna(""), sort=False):
+            schema = _schema_for(version)
+            for sq in scored_questions(schema):
+                self.questions.setdefault(sq.question.full_key, sq.question)
+            scores = score_frame(part, schema)
+            groups = [part[k].fillna("").str.strip() for k in GROUP_KEYS]
+            sums = scores.groupby(groups).sum() * sign
+            counts = scores.notna().groupby(groups).sum() * sign
+            sums.index.names = counts.index.names = GROUP_KEYS
+            self.sums = sums if self.sums.empty else self.sums.add(sums, fill_value=0)
+            self.counts = counts if self.counts.empty else self.counts.add(counts, fill_value=0)
+        self.submissions += len(df) * sign
+
+    def question_scores(self, by=PARTNER_KEY):
+        """
+        Mean score per question for each value of `by` (one of `GROUP_KEYS`),
+        or overall when `by` is None.
+        """
+        if self.sums.empty:
+            return pd.DataFrame(columns=list(self.questions))
+        if by is None:
+            scores = (self.sums.sum() / self.counts.sum()).to_frame("All").T
+        else:
+            scores = self.sums.groupby(level=by).sum() / self.counts.groupby(level=by).sum()
+        return scores.reindex(columns=list(self.questions))
+
+    def section_scores(self, by=PARTNER_KEY):
+        """
+        Answer-weighted mean score per section for each value of `by`.
+        """
+        if self.sums.empty:
+            return pd.DataFrame()
+        if by is None:
+            sums, counts = self.sums.sum().to_frame("All").T, self.counts.sum().to_frame("All").T
+        else:
+            sums, counts = self.sums.groupby(level=by).sum(), self.counts.groupby(level=by).sum()
+        section_of = pd.Series({key: question.section for key, question in self.questions.items()})
+        by_section = lambda frame: frame.reindex(columns=section_of.index).T.groupby(section_of, sort=False).sum().T
+        return by_section(sums) / by_section(counts)
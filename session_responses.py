@@ -0,0 +1,155 @@
+"""
+Compact answers of one survey session.
+
+`Responses` replaces the plain dict of answers held in every session. Choice
+and date answers are kept as integers in one array per section (option index
+for single choice, option bitmask for multi-select, ordinal for dates, -1 when
+unanswered); free text and remarks are kept only when not empty. Reading an
+answer expands it back to the bank's option string, list of options or date,
+so rendering, drafts, review and export see the same values as before.
+"""
+import array
+from datetime import date
+
+from questions import DATE, MULTISELECT, RADIO, get_schema
+
+UNSET = -1
+_MISSING = object()
+
+
+def _is_blank(value):
+    return value is None or value == "" or value == []
+
+
+class Responses:
+    """
+    Answers keyed by response column, with the `get` / `[]` interface of a
+    dict. Positions in the section records come from the schema's
+    `record_slots`; only the bank version is pickled with the answers.
+    """
+    __slots__ = ("version", "records", "text", "_schema")
+
+    def __init__(self, schema, values=None):
+        self.version = schema.version
+        self._schema = schema
+        self.records = {}  # section -> array of codes
+        self.text = {}  # column -> free text, remarks, or an answer the current options cannot encode
+        if values:
+            self.update(values)
+
+    @classmethod
+    def from_submission(cls, schema, submission):
+        """
+        Session answers from a stored submission (column -> stored text).
+        """
+        responses = cls(schema)
+        for column in schema.columns:
+            value = submission.get(column)
+            if value in (None, ""):
+                continue
+            question = schema.by_key.get(column)
+            if question is not None and question.widget == MULTISELECT:
+                value = value.split("; ")
+            responses[column] = value
+        return responses
+
+    def __getstate__(self):
+        return self.version, self.records, self.text
+
+    def __setstate__(self, state):
+        self.version, self.records, self.text = state
+        self._schema = None
+
+    @property
+    def schema(self):
+        if self._schema is None:
+            self._schema = get_schema(self.version)
+        return self._schema
+
+    @staticmethod
+    def _encode(question, value):
+        if question.widget == RADIO:
+            return question.option_index.get(value, UNSET)
+        if question.widget == MULTISELECT:
+            mask = 0
+            for option in value:
+                index = question.option_index.get(option)
+                if index is None:
+                    return UNSET
+                mask |= 1 << index
+            return mask
+        if question.widget == DATE:
+            if isinstance(value, date):
+                return value.toordinal()
+            try:
+                return date.fromisoformat(str(value)[:10]).toordinal()
+            except ValueError:
+                return UNSET
+        return UNSET
+
+    @staticmethod
+    def _decode(question, code):
+        if question.widget == RADIO:
+            return question.options[code]
+        if question.widget == MULTISELECT:
+            return [option for i, option in enumerate(question.options) if code >> i & 1]
+        return date.fromordinal(code)
+
+    def _record(self, section):
+        record = self.records.get(section)
+        if record is None:
+            size = sum(1 for s, _ in self.schema.record_slots.values() if s == section)
+            record = self.records[section] = array.array("q", [UNSET]) * size
+        return record
+
+    def get(self, key, default=None):
+        slot = self.schema.record_slots.get(key)
+        if slot is not None:
+            record = self.records.get(slot[0])
+            if record is not None and record[slot[1]] != UNSET:
+                return self._decode(self.schema.by_key[key], record[slot[1]])
+        return self.text.get(key, default)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key, value):
+        self.text.pop(key, None)
+        slot = self.schema.record_slots.get(key)
+        if slot is None:
+            if not _is_blank(value):
+                self.text[key] = value
+            return
+
+        section, position = slot
+        code = UNSET if _is_blank(value) else self._encode(self.schema.by_key[key], value)
+        if code == UNSET:
+            if section in self.records:
+                self.records[section][position] = UNSET
+            if not _is_blank(value):
+                # e.g. an option of an older bank restored from a draft
+                self.text[key] = value
+            return
+        self._record(section)[position] = code
+
+    def __delitem__(self, key):
+        self[key] = None
+
+    def update(self, values):
+        for key, value in values.items():
+            self[key] = value
+
+    def items(self):
+        """
+        Answered columns and their expanded values, in schema order.
+        """
+        for column in self.schema.columns:
+            value = self.get(column)
+            if value is not None:
+                yield column, value
@@ -0,0 +1,258 @@
+"""
+Lookup index over stored submissions.
+
+A `submission_lookup` table in the store's database holds, per submission,
+its normalised respondent (email, contact number) and location (Dairy
+Partner, BMC/MCC code, Route Number, date of response) plus the revision
+links, with an index for each kind of lookup. It is brought up to date from
+the store's rowid watermark before every lookup, so rows written by the app,
+the submission queue or `ingest.py` are all found without scanning the
+submissions table.
+
+Edits are stored as new revisions: a submission whose `supersedes` names an
+earlier one replaces it, and lookups return only current revisions unless
+asked otherwise. When two revisions name the same submission, the later one
+replaces the earlier revision, and the index records that as its `supersedes`.
+"""
+import sqlite3
+import threading
+
+from questions import BMC_CODE_KEY, CONTACT_KEY, EMAIL_KEY, PARTNER_KEY, RESPONSE_DATE_KEY, ROUTE_KEY
+
+TABLE = "submission_lookup"
+LOCATION_FIELDS = ["partner", "bmc_code", "route", "response_date"]
+FIELDS = ["submission_id", "submitted_at", "email", "contact"] + LOCATION_FIELDS + ["supersedes", "superseded_by"]
+# Store columns read for each field (all but `superseded_by`, which is derived)
+SOURCE_COLUMNS = [
+    "submission_id", "submission_timestamp", EMAIL_KEY, CONTACT_KEY,
+    PARTNER_KEY, BMC_CODE_KEY, ROUTE_KEY, RESPONSE_DATE_KEY, "supersedes",
+]
+
+
+def normalise_text(value):
+    """
+    Case- and whitespace-insensitive form of a free-text value, None when blank.
+    """
+    value = " ".join(str(value or "").split()).lower()
+    return value or None
+
+
+def normalise_contact(value):
+    """
+    The last 10 digits of a phone number, so "+91 98765-43210" matches "9876543210".
+    """
+    digits = "".join(c for c in str(value or "") if c.isdigit())
+    return digits[-10:] or None
+
+
+def lookup_row(submission):
+    """
+    Normalised lookup fields (see `FIELDS`, without `superseded_by`) of a submission dict.
+    """
+    return (
+        submission.get("submission_id"),
+        submission.get("submission_timestamp"),
+        normalise_text(submission.get(EMAIL_KEY)),
+        normalise_contact(submission.get(CONTACT_KEY)),
+        normalise_text(submission.get(PARTNER_KEY)),
+        normalise_text(submission.get(BMC_CODE_KEY)),
+        normalise_text(submission.get(ROUTE_KEY)),
+        (str(submission.get(RESPONSE_DATE_KEY) or "")[:10]) or None,
+        submission.get("supersedes") or None,
+    )
+
+
+class SubmissionIndex:
+    """
+    Indexed lookups over a `SQLiteSubmissionStore`. Results are dicts with the
+    keys in `FIELDS`, newest first.
+    """
+
+    def __init__(self, store, chunk_size=5000):
+        self.store = store
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        conn = self._connect()
+        try:
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS {TABLE} (
+                    submission_id TEXT PRIMARY KEY, submitted_at TEXT, email TEXT, contact TEXT,
+                    partner TEXT, bmc_code TEXT, route TEXT, response_date TEXT,
+                    supersedes TEXT, superseded_by TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_lookup_email ON {TABLE} (email);
+                CREATE INDEX IF NOT EXISTS idx_lookup_contact ON {TABLE} (contact);
+                CREATE INDEX IF NOT EXISTS idx_lookup_location ON {TABLE} ({", ".join(LOCATION_FIELDS)});
+                CREATE TABLE IF NOT EXISTS {TABLE}_state (watermark INTEGER NOT NULL);
+            """)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.store.path, timeout=self.store.timeout, isolation_level=None)
+
+    def refresh(self):
+        """
+        Indexes submissions added to the store since the last refresh.
+        """
+        upto = self.store.last_rowid()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(f"SELECT watermark FROM {TABLE}_state").fetchone()
+                watermark = row[0] if row else 0
+                if upto <= watermark:
+                    return
+                conn.execute("BEGIN IMMEDIATE")
+                rows = self.store.iter_rows(
+                    columns=SOURCE_COLUMNS, after_rowid=watermark, upto_rowid=upto, chunk_size=self.chunk_size
+                )
+                entries = [lookup_row(dict(zip(SOURCE_COLUMNS, r))) for r in rows]
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO {TABLE} ({', '.join(FIELDS[:-1])}) VALUES ({', '.join('?' for _ in FIELDS[:-1])})",
+                    entries,
+                )
+                for entry in entries:
+                    if entry[-1]:
+                        self._link_revision(conn, entry[0], entry[-1])
+                conn.execute(f"DELETE FROM {TABLE}_state")
+                conn.execute(f"INSERT INTO {TABLE}_state (watermark) VALUES (?)", (upto,))
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    def _link_revision(self, conn, submission_id, supersedes):
+        """
+        Makes `submission_id` the next revision of the assessment `supersedes`
+        belongs to. A revision of an already replaced submission (two edits of
+        the same revision) replaces the current head instead, so every
+        assessment stays a single chain.
+        """
+        head, seen = supersedes, set()
+        while head not in seen:
+            seen.add(head)
+            row = conn.execute(f"SELECT superseded_by FROM {TABLE} WHERE submission_id = ?", (head,)).fetchone()
+            if row is None or row[0] is None:
+                break
+            head = row[0]
+        if head == submission_id:
+            return  # A revision of itself
+        conn.execute(f"UPDATE {TABLE} SET supersedes = ? WHERE submission_id = ?", (head, submission_id))
+        conn.execute(f"UPDATE {TABLE} SET superseded_by = ? WHERE submission_id = ?", (submission_id, head))
+
+    def _query(self, clauses, params, current_only=True, limit=50):
+        if current_only:
+            clauses = clauses + ["superseded_by IS NULL"]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        self.refresh()
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {', '.join(FIELDS)} FROM {TABLE}{where} ORDER BY submitted_at DESC LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def by_id(self, submission_id):
+        """
+        The lookup entry of one submission (any revision), or None.
+        """
+        found = self._query(["submission_id = ?"], [submission_id], current_only=False, limit=1)
+        return found[0] if found else None
+
+    def get_submission(self, submission_id):
+        """
+        The stored submission as a column -> value dict, or None. Every column
+        of the table is read: `self.store` may be open with another question
+        bank version's columns than the one the submission was made with.
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(f"SELECT * FROM {self.store.TABLE} WHERE submission_id = ?", (submission_id,))
+            row = cursor.fetchone()
+            return dict(zip([d[0] for d in cursor.description], row)) if row else None
+        finally:
+            conn.close()
+
+    def by_respondent(self, email=None, contact=None, current_only=True, limit=50):
+        """
+        Submissions by the respondent with this email or contact number.
+        """
+        clauses, params = [], []
+        if normalise_text(email):
+            clauses.append("email = ?")
+            params.append(normalise_text(email))
+        if normalise_contact(contact):
+            clauses.append("contact = ?")
+            params.append(normalise_contact(contact))
+        if not clauses:
+            return []
+        return self._query([f"({' OR '.join(clauses)})"], params, current_only, limit)
+
+    def by_location(self, partner, bmc_code=None, route=None, response_date=None, current_only=True, limit=50):
+        """
+        Submissions for a location, narrowed from Dairy Partner down to BMC/MCC
+        code, route and date of response (each given part must be preceded by
+        the previous ones to use the index).
+        """
+        values = [normalise_text(partner), normalise_text(bmc_code), normalise_text(route), response_date or None]
+        clauses, params = [], []
+        for field, value in zip(LOCATION_FIELDS, values):
+            if value is None:
+                break
+            clauses.append(f"{field} = ?")
+            params.append(value)
+        if not clauses:
+            return []
+        return self._query(clauses, params, current_only, limit)
+
+    def history(self, submission_id):
+        """
+        All revisions of the assessment `submission_id` belongs to, oldest first.
+        """
+        entry = self.by_id(submission_id)
+        if entry is None:
+            return []
+        chain = [entry]
+        while chain[0]["supersedes"]:
+            previous = self.by_id(chain[0]["supersedes"])
+            if previous is None:
+                break
+            chain.insert(0, previous)
+        while chain[-1]["superseded_by"]:
+            following = self.by_id(chain[-1]["superseded_by"])
+            if following is None:
+                break
+            chain.append(following)
+        return chain
+
+    def latest(self, submission_id):
+        """
+        The current revision of the assessment `submission_id` belongs to, or None.
+        """
+        chain = self.history(submission_id)
+        return chain[-1] if chain else None
+
+    def duplicates(self, submission):
+        """
+        Current submissions that look like earlier copies of `submission`: the
+        same respondent on the same date of response, or the same location and
+        date. Each result carries a `reason`.
+        """
+        entry = dict(zip(FIELDS, lookup_row(submission)))
+        found = {}
+        if entry["response_date"]:
+            for match in self.by_respondent(entry["email"], entry["contact"]):
+                if match["response_date"] == entry["response_date"]:
+                    found.setdefault(match["submission_id"], dict(match, reason="same respondent and date"))
+            if entry["partner"] and entry["bmc_code"] and entry["route"]:
+                for match in self.by_location(entry["partner"], entry["bmc_code"], entry["route"], entry["response_date"]):
+                    found.setdefault(match["submission_id"], dict(match, reason="same location and date"))
+        found.pop(entry["submission_id"], None)
+        return sorted(found.values(), key=lambda m: m["submitted_at"] or "", reverse=True)
@@ -0,0 +1,336 @@
+"""
+Durable hand-off between "Submit Final" and the submission store.
+
+`enqueue()` only appends the submission to a local SQLite spool keyed by
+`submission_id`, so the request returns as soon as the submission is safe on
+disk, and pressing the button twice queues it once. A background writer
+drains the spool in batches (one store transaction per batch), retries
+failed batches with backoff, and the spool survives restarts: anything left
+in it is written when the queue is next started.
+
+When a batch fails for a reason other than the store being unavailable, its
+submissions are retried one by one, so one bad submission cannot hold back
+the others. A submission that still fails after `MAX_ATTEMPTS` writes is moved
+to the `dead_letters` table; it no longer counts towards `MAX_PENDING` and
+can be put back with `requeue_dead_letters()` once the cause is fixed.
+
+The spool must be on local disk: it is what "Submit Final" waits for, and
+SQLite's WAL mode does not work on network filesystems. Its path is set with
+the TNS_QUEUE_DB environment variable and defaults to the user's local state
+directory, apart from the submission store, which may be on a shared volume.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import instrumentation
+
+QUEUE_DB_FILE = os.environ.get("TNS_QUEUE_DB") or os.path.join(
+    os.path.expanduser("~"), ".local", "state", "tns", "self_assessment_TNS_queue.db"
+)
+# Where the spool was kept before it moved to local disk (next to the store)
+FORMER_QUEUE_DB_FILE = "self_assessment_TNS_queue.db"
+MAX_PENDING = 5000
+BATCH_SIZE = 200
+LINGER_SECONDS = 0.25
+MAX_BACKOFF_SECONDS = 60.0
+MAX_ATTEMPTS = 5
+# An idle writer also checks the spool this often, for submissions queued or
+# requeued by another process (e.g. the admin Performance page).
+IDLE_POLL_SECONDS = 30.0
+
+# Failures that say nothing about the submissions (store locked, volume
+# unavailable): the batch is retried after a backoff without counting attempts.
+TRANSIENT_ERRORS = (sqlite3.OperationalError, OSError)
+
+logger = logging.getLogger("tns.queue")
+
+
+class QueueFull(Exception):
+    """
+    Raised by `enqueue()` when `max_pending` submissions are already waiting
+    to be written.
+    """
+
+
+class SubmissionQueue:
+    """
+    Spool of submissions waiting to be written. `store_for(version)` returns
+    the store for a question bank version; it is only needed by the writer.
+    """
+
+    def __init__(self, path, store_for=None, max_pending=MAX_PENDING, batch_size=BATCH_SIZE,
+                 linger_seconds=LINGER_SECONDS, max_attempts=MAX_ATTEMPTS, timeout=30.0):
+        self.path = path
+        self.store_for = store_for
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.last_error = None
+        self._wakeup = threading.Event()
+        self._thread = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS queue (
+                    submission_id TEXT PRIMARY KEY, version TEXT, payload TEXT, enqueued_at REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT
+                )
+            """)
+            # Spools created before failed writes were tracked
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(queue)")}
+            if "attempts" not in existing:
+                conn.execute("ALTER TABLE queue ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+            if "last_error" not in existing:
+                conn.execute("ALTER TABLE queue ADD COLUMN last_error TEXT")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS dead_letters (
+                    submission_id TEXT PRIMARY KEY, version TEXT, payload TEXT, enqueued_at REAL,
+                    failed_at REAL, attempts INTEGER, error TEXT
+                )
+            """)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def enqueue(self, submission, version):
+        """
+        Durably queues one submission dict. Returns False if a submission with
+        the same `submission_id` is already queued. Raises `QueueFull` when the
+        writer has fallen too far behind.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            pending = conn.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+            if pending >= self.max_pending:
+                conn.execute("ROLLBACK")
+                raise QueueFull(f"{pending} submissions are waiting to be saved; please try again shortly.")
+            added = conn.execute(
+                "INSERT OR IGNORE INTO queue (submission_id, version, payload, enqueued_at) VALUES (?, ?, ?, ?)",
+                (submission["submission_id"], version, json.dumps(submission), time.time()),
+            ).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        self._wakeup.set()
+        return added == 1
+
+    def pending(self):
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+        finally:
+            conn.close()
+
+    def failing(self):
+        """
+        Queued submissions whose last write failed, as dicts (submission_id,
+        version, enqueued_at, attempts, last_error).
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT submission_id, version, enqueued_at, attempts, last_error FROM queue "
+                "WHERE last_error IS NOT NULL ORDER BY enqueued_at"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(zip(["submission_id", "version", "enqueued_at", "attempts", "last_error"], row)) for row in rows]
+
+    def dead_letters(self):
+        """
+        Submissions given up on after `max_attempts` failed writes, as dicts
+        (submission_id, version, enqueued_at, failed_at, attempts, error).
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT submission_id, version, enqueued_at, failed_at, attempts, error FROM dead_letters "
+                "ORDER BY failed_at"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            dict(zip(["submission_id", "version", "enqueued_at", "failed_at", "attempts", "error"], row))
+            for row in rows
+        ]
+
+    def requeue_dead_letters(self):
+        """
+        Moves every dead letter back into the queue with its attempts reset.
+        Returns how many were requeued.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            moved = conn.execute(
+                "INSERT OR IGNORE INTO queue (submission_id, version, payload, enqueued_at) "
+                "SELECT submission_id, version, payload, enqueued_at FROM dead_letters"
+            ).rowcount
+            conn.execute("DELETE FROM dead_letters")
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        self._wakeup.set()
+        return moved
+
+    def _write(self, version, rows):
+        self.store_for(version).add_many([json.loads(row[2]) for row in rows], ignore_duplicates=True)
+
+    def flush(self):
+        """
+        Writes up to `batch_size` queued submissions, one store transaction per
+        question bank version, and removes them from the spool. Returns how
+        many were written. Submissions already in the store are skipped, so a
+        batch retried after a crash is not duplicated.
+
+        If a version's transaction fails, its submissions are written one by
+        one; those that fail again get an attempt counted and, after
+        `max_attempts`, are moved to the dead letters. `TRANSIENT_ERRORS`
+        are raised without counting attempts. Sets `last_error` to the last
+        failure of this flush, or None.
+        """
+        conn = self._connect()
+        try:
+            batch = conn.execute(
+                "SELECT submission_id, version, payload, enqueued_at, attempts FROM queue "
+                "ORDER BY enqueued_at LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+        finally:
+            conn.close()
+        self.last_error = None
+        if not batch:
+            return 0
+
+        by_version = {}
+        for row in batch:
+            by_version.setdefault(row[1], []).append(row)
+        written, failed = [], []
+        with instrumentation.timed("queue_flush", batch=len(batch)):
+            for version, rows in by_version.items():
+                try:
+                    self._write(version, rows)
+                    written.extend(rows)
+                except TRANSIENT_ERRORS:
+                    raise
+                except Exception:
+                    for row in rows:
+                        try:
+                            self._write(version, [row])
+                            written.append(row)
+                        except TRANSIENT_ERRORS:
+                            raise
+                        except Exception as e:
+                            failed.append((row, f"{type(e).__name__}: {e}"))
+
+        self._settle(written, failed)
+        if failed:
+            self.last_error = failed[-1][1]
+        return len(written)
+
+    def _settle(self, written, failed):
+        """
+        Removes written submissions from the spool and records failed writes.
+        """
+        now = time.time()
+        dead = [(row, error) for row, error in failed if row[4] + 1 >= self.max_attempts]
+        retry = [(row, error) for row, error in failed if row[4] + 1 < self.max_attempts]
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "DELETE FROM queue WHERE submission_id = ?",
+                [(row[0],) for row in written] + [(row[0],) for row, _ in dead],
+            )
+            conn.executemany(
+                "UPDATE queue SET attempts = attempts + 1, last_error = ? WHERE submission_id = ?",
+                [(error, row[0]) for row, error in retry],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO dead_letters "
+                "(submission_id, version, payload, enqueued_at, failed_at, attempts, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(row[0], row[1], row[2], row[3], now, row[4] + 1, error) for row, error in dead],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        for row, error in retry:
+            logger.warning("Writing submission %s failed (attempt %d of %d): %s",
+                           row[0], row[4] + 1, self.max_attempts, error)
+        for row, error in dead:
+            logger.error("Submission %s moved to the dead letters after %d failed writes: %s",
+                         row[0], row[4] + 1, error)
+
+    def _note_error(self, error):
+        """
+        Records a failure that was not counted as an attempt on the waiting
+        batch, so `failing()` shows it. Best effort: the spool may be what failed.
+        """
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE queue SET last_error = ? WHERE submission_id IN "
+                "(SELECT submission_id FROM queue ORDER BY enqueued_at LIMIT ?)",
+                (error, self.batch_size),
+            )
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+    def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                written = self.flush()
+            except Exception as e:
+                # The batch stays in the spool and is retried after the backoff.
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.warning("Writing queued submissions failed, retrying in %.0fs: %s", backoff, self.last_error)
+                self._note_error(self.last_error)
+                written = None
+            if self.last_error is not None:
+                # Submissions that failed are retried (or given up on) after the backoff.
+                time.sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+                continue
+            backoff = 1.0
+            if written < self.batch_size:
+                self._wakeup.wait(IDLE_POLL_SECONDS)
+                self._wakeup.clear()
+                # Let a burst of submissions gather into one batch.
+                time.sleep(self.linger_seconds)
+
+    def start(self):
+        """
+        Starts the background writer (once). Submissions left in the spool by
+        a previous run are written first.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="submission-writer", daemon=True)
+            self._thread.start()
+        return self._thread
@@ -0,0 +1,240 @@
+"""
+Storage backends for final survey submissions.
+
+Every submission is written as one row with the same fixed column set, taken
+from the question schema, so rows can never drift out of alignment.
+"""
+import hashlib
+import sqlite3
+
+DB_FILE = "self_assessment_TNS_responses.db"
+# Responses appended by the app before the store existed; import them with `python ingest.py --legacy`.
+LEGACY_CSV_FILE = "self_assessment_TNS_responses.csv"
+# Question bank the CSV-era app used (question_bank/1.json)
+LEGACY_BANK_VERSION = "1"
+
+# Columns written for every submission, ahead of the question columns.
+# `supersedes` holds the id of the submission an edited revision replaces.
+META_COLUMNS = ["submission_id", "submission_timestamp", "question_bank_version", "supersedes"]
+
+
+def quote_identifier(name):
+    """
+    Quotes a column name for use in SQL (question labels contain spaces, '|', etc.).
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SubmissionStore:
+    """
+    Interface for submission storage. `columns` is the ordered list of question
+    columns; `META_COLUMNS` are always stored first.
+    """
+
+    def __init__(self, columns):
+        self.columns = META_COLUMNS + [c for c in columns if c not in META_COLUMNS]
+
+    def add(self, submission):
+        """
+        Atomically stores one submission dict (column -> value).
+        """
+        raise NotImplementedError
+
+    def add_many(self, submissions, ignore_duplicates=False):
+        """
+        Stores a batch of submission dicts in a single atomic transaction. With
+        `ignore_duplicates`, submissions whose `submission_id` is already stored
+        are skipped instead of failing the batch. Returns how many were stored.
+        """
+        raise NotImplementedError
+
+    def add_rows(self, rows, ignore_duplicates=False):
+        """
+        Stores a batch of rows given as sequences in `self.columns` order
+        (None for blanks) in a single atomic transaction. Used for bulk loads.
+        Returns how many were stored.
+        """
+        raise NotImplementedError
+
+    def count(self):
+        raise NotImplementedError
+
+    def revision(self):
+        """
+        Returns (row count, highest rowid); changes whenever a submission is added.
+        """
+        raise NotImplementedError
+
+    def last_rowid(self):
+        """
+        Highest rowid (0 when empty); cheaper than `revision()` for watermarks.
+        """
+        raise NotImplementedError
+
+    def stored_columns(self):
+        """
+        Every column the store holds, including those added for other question
+        bank versions than the one `self.columns` was built from.
+        """
+        raise NotImplementedError
+
+    def iter_rows(self, equals=None, since=None, until=None, columns=None,
+                  after_rowid=None, upto_rowid=None, chunk_size=1000):
+        """
+        Yields submissions as tuples in `columns` order (default `self.columns`),
+        oldest first. `equals` maps column -> required value; `since`/`until`
+        bound the ISO submission timestamp and `after_rowid`/`upto_rowid` the
+        insertion order (see `last_rowid()`).
+        """
+        raise NotImplementedError
+
+
+class SQLiteSubmissionStore(SubmissionStore):
+    """
+    SQLite store in WAL mode. Each write runs in its own `BEGIN IMMEDIATE`
+    transaction, so concurrent sessions are serialised by SQLite's write lock
+    and a failed write leaves no partial row behind.
+    """
+
+    TABLE = "submissions"
+
+    def __init__(self, path, columns, index_columns=(), timeout=30.0):
+        super().__init__(columns)
+        self.path = path
+        self.timeout = timeout
+        self.index_columns = ["submission_timestamp"] + list(index_columns)
+        self._init_schema()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        # The submission queue drops a submission from its spool once the store
+        # commit returns, so a commit must survive a power loss (NORMAL can roll
+        # back the last WAL transactions).
+        conn.execute("PRAGMA synchronous=FULL")
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            column_defs = ", ".join(
+                f"{quote_identifier(c)} TEXT" for c in self.columns if c != "submission_id"
+            )
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} "
+                f"(submission_id TEXT NOT NULL UNIQUE, {column_defs})"
+            )
+            # New questions only ever add columns; existing rows read back as empty.
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({self.TABLE})")}
+            for column in self.columns:
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE {self.TABLE} ADD COLUMN {quote_identifier(column)} TEXT")
+            for column in self.index_columns:
+                index_name = "idx_" + hashlib.sha1(column.encode()).hexdigest()[:12]
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} "
+                    f"ON {self.TABLE} ({quote_identifier(column)})"
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def add(self, submission):
+        self.add_many([submission])
+
+    def add_many(self, submissions, ignore_duplicates=False):
+        fields = set()
+        for submission in submissions:
+            fields.update(submission)
+        unknown = fields - set(self.columns)
+        if unknown:
+            raise ValueError(f"Unknown submission fields: {sorted(unknown)}")
+        return self.add_rows([
+            [None if submission.get(c) in (None, "") else submission[c] for c in self.columns]
+            for submission in submissions
+        ], ignore_duplicates)
+
+    def add_rows(self, rows, ignore_duplicates=False):
+        sql = (
+            f"INSERT {'OR IGNORE ' if ignore_duplicates else ''}INTO {self.TABLE} ({', '.join(quote_identifier(c) for c in self.columns)}) "
+            f"VALUES ({', '.join('?' for _ in self.columns)})"
+        )
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            stored = conn.executemany(sql, rows).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return stored
+
+    def count(self):
+        conn = self._connect()
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def revision(self):
+        conn = self._connect()
+        try:
+            return conn.execute(f"SELECT COUNT(*), MAX(rowid) FROM {self.TABLE}").fetchone()
+        finally:
+            conn.close()
+
+    def last_rowid(self):
+        conn = self._connect()
+        try:
+            return conn.execute(f"SELECT MAX(rowid) FROM {self.TABLE}").fetchone()[0] or 0
+        finally:
+            conn.close()
+
+    def stored_columns(self):
+        conn = self._connect()
+        try:
+            return [row[1] for row in conn.execute(f"PRAGMA table_info({self.TABLE})")]
+        finally:
+            conn.close()
+
+    def iter_rows(self, equals=None, since=None, until=None, columns=None,
+                  after_rowid=None, upto_rowid=None, chunk_size=1000):
+        clauses, params = [], []
+        for column, value in (equals or {}).items():
+            clauses.append(f"{quote_identifier(column)} = ?")
+            params.append(value)
+        if since:
+            clauses.append("submission_timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("submission_timestamp <= ?")
+            params.append(until)
+        if after_rowid is not None:
+            clauses.append("rowid > ?")
+            params.append(after_rowid)
+        if upto_rowid is not None:
+            clauses.append("rowid <= ?")
+            params.append(upto_rowid)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"SELECT {', '.join(quote_identifier(c) for c in columns or self.columns)} "
+                f"FROM {self.TABLE}{where} ORDER BY rowid",
+                params,
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
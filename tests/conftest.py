@@ -0,0 +1,45 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+# The app's modules live at the repository root, next to this directory.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import questions  # noqa: E402
+
+NEW_QUESTION_SECTION = "2. Dairy Extension Services"
+NEW_QUESTION_GROUP = "2.1 Services"
+NEW_QUESTION = "2.1.9 Digital advisory"
+NEW_QUESTION_OPTIONS = ["a. Not used", "b. Used by some farmers", "c. Used by all farmers"]
+
+
+@pytest.fixture
+def bank_dir(tmp_path, monkeypatch):
+    """
+    A private copy of the question bank directory, rescanned on every lookup.
+    `publish_version(version)` adds a version with one extra question.
+    """
+    directory = tmp_path / "question_bank"
+    directory.mkdir()
+    shutil.copy(os.path.join(questions.QUESTION_BANK_DIR, "1.json"), directory / "1.json")
+    monkeypatch.setattr(questions, "_cache", questions._QuestionBankCache(str(directory)))
+    monkeypatch.setattr(questions, "RELOAD_INTERVAL_SECONDS", 0)
+    return directory
+
+
+@pytest.fixture
+def publish_version(bank_dir):
+    def publish(version):
+        with open(bank_dir / "1.json", encoding="utf-8") as f:
+            bank = json.load(f)
+        bank["version"] = version
+        bank["questions"][NEW_QUESTION_SECTION][NEW_QUESTION_GROUP][NEW_QUESTION] = NEW_QUESTION_OPTIONS
+        with open(bank_dir / f"{version}.json", "w", encoding="utf-8") as f:
+            json.dump(bank, f)
+        schema = questions.get_schema(version)
+        return next(q for q in schema.questions if q.label == NEW_QUESTION)
+    return publish
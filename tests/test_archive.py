@@ -0,0 +1,57 @@
+import glob
+import os
+
+import pyarrow.parquet as pq
+import pytest
+
+import archive
+from questions import PARTNER_KEY, get_schema
+from submission_store import SQLiteSubmissionStore
+
+
+def make_store(tmp_path):
+    return SQLiteSubmissionStore(str(tmp_path / "store.db"), get_schema().columns)
+
+
+def add(store, n, partner, start=0):
+    store.add_many([
+        {"submission_id": f"{partner}-{start + i}", "submission_timestamp": "2026-03-01T10:00:00", PARTNER_KEY: partner}
+        for i in range(n)
+    ])
+
+
+@pytest.mark.parametrize("partner", ["Parag", "Sunfresh Lactalis"])
+def test_compaction_merges_partitions_with_encoded_names(tmp_path, partner):
+    store, archive_dir = make_store(tmp_path), str(tmp_path / "archive")
+    for run in range(archive.MAX_FILES_PER_PARTITION + 2):
+        add(store, 1, partner, start=run)
+        archive.compact(store, archive_dir)
+
+    files = glob.glob(os.path.join(archive_dir, "month=2026-03", "dairy_partner=*", "*.parquet"))
+    assert len(files) <= archive.MAX_FILES_PER_PARTITION
+    frame = archive.read_archive(archive_dir, partners=[partner])
+    assert sorted(frame["submission_id"]) == sorted(f"{partner}-{i}" for i in range(archive.MAX_FILES_PER_PARTITION + 2))
+
+
+def test_interrupted_compaction_resumes_without_duplicates(tmp_path, monkeypatch):
+    store, archive_dir = make_store(tmp_path), str(tmp_path / "archive")
+    add(store, 25, "Parag")
+
+    write = pq.write_to_dataset
+    calls = []
+
+    def failing_write(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise OSError("disk went away")
+        return write(*args, **kwargs)
+
+    monkeypatch.setattr(pq, "write_to_dataset", failing_write)
+    with pytest.raises(OSError):
+        archive.compact(store, archive_dir, chunk_size=10)
+    assert archive._read_manifest(archive_dir)["watermark"] == 10
+
+    monkeypatch.setattr(pq, "write_to_dataset", write)
+    assert archive.compact(store, archive_dir, chunk_size=10) == 15
+    frame = archive.read_archive(archive_dir)
+    assert len(frame) == 25 and frame["submission_id"].is_unique
@@ -0,0 +1,34 @@
+import pandas as pd
+
+import ingest
+from questions import RESPONSE_DATE_KEY
+
+
+def test_date_column_with_mixed_formats_is_read_day_first():
+    df = pd.DataFrame({RESPONSE_DATE_KEY: ["05/01/2024", "2024-02-03", "31/01/2024", "2024-03-04", "07-02-2024", ""]})
+
+    normalised, errors = ingest.validate_frame(df)
+
+    assert errors.empty
+    assert normalised[RESPONSE_DATE_KEY].tolist() == [
+        "2024-01-05", "2024-02-03", "2024-01-31", "2024-03-04", "2024-02-07", "",
+    ]
+
+
+def test_unparseable_dates_are_reported():
+    df = pd.DataFrame({RESPONSE_DATE_KEY: ["2024-02-03", "31/02/2024", "01/13/2024", "soon"]})
+
+    _, errors = ingest.validate_frame(df)
+
+    assert errors["row"].tolist() == [1, 2, 3]
+    assert set(errors["error"]) == {"not a valid date"}
+
+
+def test_columns_of_a_version_published_after_import_are_accepted(bank_dir, publish_version):
+    new_question = publish_version("2")
+    df = pd.DataFrame({new_question.full_key: [new_question.options[0], "not an option"]})
+
+    _, errors = ingest.validate_frame(df)
+
+    assert errors["row"].tolist() == [1]
+    assert errors["error"].tolist() == ["not one of the allowed options"]
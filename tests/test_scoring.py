@@ -0,0 +1,68 @@
+import pytest
+
+from questions import PARTNER_KEY, get_schema
+from scoring import ScoreAggregator, ScoredQuestion
+from submission_store import SQLiteSubmissionStore
+
+
+def submission(submission_id, version, **answers):
+    return {
+        "submission_id": submission_id, "submission_timestamp": f"2026-01-01T00:00:{len(submission_id):02d}",
+        "question_bank_version": version, PARTNER_KEY: "Parag", **answers,
+    }
+
+
+def top_option(question):
+    scored = ScoredQuestion(question)
+    return next(option for option, level in scored.levels.items() if level == scored.max_level)
+
+
+def first_scored(schema):
+    return next(q for q in schema.questions if q.widget == "radio" and q.section.startswith("1."))
+
+
+def test_questions_of_a_hot_reloaded_version_are_scored(tmp_path, bank_dir, publish_version):
+    path = str(tmp_path / "store.db")
+    old = get_schema("1")
+    aggregator = ScoreAggregator(SQLiteSubmissionStore(path, old.columns))
+    question = first_scored(old)
+    SQLiteSubmissionStore(path, old.columns).add(submission("a", "1", **{question.full_key: top_option(question)}))
+    aggregator.refresh()
+
+    new_question = publish_version("2")
+    # The app opens the store for the new version, which adds its columns.
+    SQLiteSubmissionStore(path, get_schema("2").columns).add(
+        submission("bb", "2", **{question.full_key: question.options[0], new_question.full_key: top_option(new_question)})
+    )
+    aggregator.refresh()
+
+    scores = aggregator.question_scores(by=None).iloc[0]
+    assert scores[new_question.full_key] == pytest.approx(1.0)
+    assert scores[question.full_key] == pytest.approx((1 + 1 / ScoredQuestion(question).max_level) / 2)
+    assert aggregator.questions[new_question.full_key].label == new_question.label
+    assert new_question.section in aggregator.section_scores(by=None).columns
+
+
+def test_two_revisions_of_the_same_submission_count_once(tmp_path):
+    schema = get_schema("1")
+    store = SQLiteSubmissionStore(str(tmp_path / "store.db"), schema.columns)
+    question = first_scored(schema)
+    aggregator = ScoreAggregator(store)
+    store.add(submission("a", "1", **{question.full_key: top_option(question)}))
+    aggregator.refresh()
+    # Both edits were started from the original; the later one is the current revision.
+    store.add_many([
+        dict(submission("b", "1", **{question.full_key: question.options[0]}), supersedes="a"),
+        dict(submission("cc", "1", **{question.full_key: top_option(question)}), supersedes="a"),
+    ])
+    aggregator.refresh()
+    fresh = ScoreAggregator(store)
+    fresh.refresh()
+
+    for folded in (aggregator, fresh):
+        assert folded.submissions == 1
+        scores = folded.question_scores(by=None).iloc[0]
+        assert scores[question.full_key] == pytest.approx(1.0)
+        assert folded.counts.sum()[question.full_key] == 1
+        # Sums are added and subtracted, so allow for float residue.
+        assert scores.dropna().le(1 + 1e-9).all()
@@ -0,0 +1,67 @@
+import pickle
+from datetime import date
+
+from drafts import decode_sections, encode_section
+from questions import PARTNER_KEY, RESPONSE_DATE_KEY, get_schema
+from session_responses import Responses
+
+SCHEMA = get_schema("1")
+MULTISELECT_QUESTION = next(q for q in SCHEMA.questions if q.widget == "multiselect")
+RADIO_QUESTION = next(q for q in SCHEMA.questions if q.widget == "radio" and q.section.startswith("1."))
+NAME_KEY = "Respondent and Location Details|Name of the respondent"
+
+
+def answers():
+    return {
+        PARTNER_KEY: SCHEMA.by_key[PARTNER_KEY].options[1],
+        NAME_KEY: "Asha",
+        RESPONSE_DATE_KEY: date(2024, 1, 31),
+        RADIO_QUESTION.full_key: RADIO_QUESTION.options[-1],
+        RADIO_QUESTION.remarks_key: "Checked with the vet",
+        MULTISELECT_QUESTION.full_key: list(MULTISELECT_QUESTION.options[:2]) + [MULTISELECT_QUESTION.options[4]],
+    }
+
+
+def test_answers_read_back_as_written():
+    responses = Responses(SCHEMA, answers())
+
+    assert dict(responses.items()) == answers()
+    assert responses.text == {NAME_KEY: "Asha", RADIO_QUESTION.remarks_key: "Checked with the vet"}
+
+
+def test_clearing_and_unknown_options():
+    responses = Responses(SCHEMA, answers())
+    responses[RADIO_QUESTION.full_key] = ""
+    del responses[NAME_KEY]
+    # e.g. an option renamed since a draft was saved
+    responses[MULTISELECT_QUESTION.full_key] = ["Retired option"]
+
+    assert RADIO_QUESTION.full_key not in responses
+    assert responses.get(NAME_KEY) is None
+    assert responses[MULTISELECT_QUESTION.full_key] == ["Retired option"]
+    responses[MULTISELECT_QUESTION.full_key] = [MULTISELECT_QUESTION.options[0]]
+    assert responses[MULTISELECT_QUESTION.full_key] == [MULTISELECT_QUESTION.options[0]]
+    assert MULTISELECT_QUESTION.full_key not in responses.text
+
+
+def test_pickle_round_trip_keeps_only_the_version():
+    restored = pickle.loads(pickle.dumps(Responses(SCHEMA, answers())))
+
+    assert restored._schema is None
+    assert dict(restored.items()) == answers()
+
+
+def test_stored_submission_round_trip():
+    stored = {
+        key: "; ".join(value) if isinstance(value, list) else value.isoformat() if isinstance(value, date) else value
+        for key, value in answers().items()
+    }
+
+    assert dict(Responses.from_submission(SCHEMA, stored).items()) == answers()
+
+
+def test_draft_sections_round_trip():
+    responses = Responses(SCHEMA, answers())
+    payloads = {section: encode_section(responses, section, SCHEMA) for section in SCHEMA.section_columns}
+
+    assert decode_sections(payloads, SCHEMA) == answers()
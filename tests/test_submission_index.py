@@ -0,0 +1,35 @@
+from questions import EMAIL_KEY, get_schema
+from submission_index import SubmissionIndex
+from submission_store import SQLiteSubmissionStore
+
+
+def revision(submission_id, second, supersedes=None):
+    return {
+        "submission_id": submission_id, "submission_timestamp": f"2026-01-01T00:00:{second:02d}",
+        "question_bank_version": "1", "supersedes": supersedes, EMAIL_KEY: "Asha@example.org",
+    }
+
+
+def test_two_revisions_of_the_same_submission_form_one_chain(tmp_path):
+    store = SQLiteSubmissionStore(str(tmp_path / "store.db"), get_schema("1").columns)
+    index = SubmissionIndex(store)
+    store.add(revision("a", 1))
+    index.refresh()
+    # Both edits were started from the original, e.g. in two browser tabs.
+    store.add_many([revision("b", 2, supersedes="a"), revision("c", 3, supersedes="a")])
+
+    assert [entry["submission_id"] for entry in index.history("a")] == ["a", "b", "c"]
+    assert index.by_id("c")["supersedes"] == "b"
+    assert index.latest("b")["submission_id"] == "c"
+    assert [entry["submission_id"] for entry in index.by_respondent(email=" asha@EXAMPLE.org")] == ["c"]
+
+
+def test_get_submission_reads_columns_of_other_versions(tmp_path, publish_version):
+    path = str(tmp_path / "store.db")
+    new_question = publish_version("2")
+    SQLiteSubmissionStore(path, get_schema("2").columns).add(dict(revision("a", 1), **{new_question.full_key: "a. Not used"}))
+
+    submission = SubmissionIndex(SQLiteSubmissionStore(path, get_schema("1").columns)).get_submission("a")
+
+    assert submission[new_question.full_key] == "a. Not used"
+    assert SubmissionIndex(SQLiteSubmissionStore(path, get_schema("1").columns)).get_submission("missing") is None
@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+from submission_queue import SubmissionQueue
+
+
+class FakeStore:
+    """
+    Stores submission dicts in memory and rejects those named in `bad`.
+    """
+
+    def __init__(self, bad=()):
+        self.bad = set(bad)
+        self.stored = {}
+
+    def add_many(self, submissions, ignore_duplicates=False):
+        for submission in submissions:
+            if submission["submission_id"] in self.bad:
+                raise ValueError(f"cannot store {submission['submission_id']}")
+        for submission in submissions:
+            self.stored.setdefault(submission["submission_id"], submission)
+        return len(submissions)
+
+
+def queue_for(tmp_path, store, **kwargs):
+    queue = SubmissionQueue(str(tmp_path / "spool" / "queue.db"), lambda version: store, **kwargs)
+    for submission_id in ("a", "b", "c"):
+        queue.enqueue({"submission_id": submission_id}, "1")
+    return queue
+
+
+def test_a_failing_submission_is_dead_lettered_without_holding_back_the_rest(tmp_path):
+    store = FakeStore(bad={"b"})
+    queue = queue_for(tmp_path, store, max_attempts=2)
+
+    assert queue.flush() == 2
+    assert sorted(store.stored) == ["a", "c"]
+    assert [f["submission_id"] for f in queue.failing()] == ["b"]
+    assert queue.last_error == "ValueError: cannot store b"
+
+    assert queue.flush() == 0
+    assert queue.pending() == 0
+    [dead] = queue.dead_letters()
+    assert (dead["submission_id"], dead["attempts"], dead["error"]) == ("b", 2, "ValueError: cannot store b")
+
+    store.bad.clear()
+    assert queue.requeue_dead_letters() == 1
+    assert queue.dead_letters() == []
+    assert queue.flush() == 1
+    assert sorted(store.stored) == ["a", "b", "c"]
+
+
+def test_transient_errors_do_not_count_attempts(tmp_path):
+    class LockedStore(FakeStore):
+        def add_many(self, submissions, ignore_duplicates=False):
+            raise sqlite3.OperationalError("database is locked")
+
+    queue = queue_for(tmp_path, LockedStore(), max_attempts=1)
+
+    with pytest.raises(sqlite3.OperationalError):
+        queue.flush()
+    assert queue.pending() == 3
+    assert queue.dead_letters() == []
+
+
+def test_enqueue_ignores_a_repeated_submission(tmp_path):
+    queue = queue_for(tmp_path, FakeStore())
+
+    assert queue.enqueue({"submission_id": "a"}, "1") is False
+    assert queue.pending() == 3
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from questions import CONTACT_KEY, EMAIL_KEY, RESPONSE_DATE_KEY, get_schema
+from validation import (
+    DateRangeRule, ExclusiveRule, PatternRule, compile_rules, parse_dates, validate_frame, validate_responses,
+)
+
+
+def test_parse_dates_reads_each_cell_with_its_own_format():
+    parsed = parse_dates(pd.Series(["05/01/2024", "2024-02-03", "31/01/2024", "2024-03-04 00:00:00", "", "x"]))
+
+    assert parsed.dt.strftime("%Y-%m-%d").tolist()[:4] == ["2024-01-05", "2024-02-03", "2024-01-31", "2024-03-04"]
+    assert parsed[4:].isna().all()
+
+
+def test_date_range_rule_on_a_column_with_mixed_formats():
+    rule = DateRangeRule("date", min="2024-01-01", max="2024-12-31")
+    values = pd.Series(["05/01/2024", "2024-02-03", "31/01/2024", "31/12/2023", "2025-01-01", "", "not a date"])
+
+    assert rule.invalid(values).tolist() == [False, False, False, True, True, False, True]
+
+
+def test_compiled_rules_check_sessions_and_frames():
+    schema = get_schema("1")
+    multiselect = next(q for q in schema.questions if q.widget == "multiselect")
+    none_of_the_above = next(o for o in multiselect.options if o == "None of the above")
+    columns = [EMAIL_KEY, CONTACT_KEY, RESPONSE_DATE_KEY, multiselect.full_key]
+
+    assert {type(rule) for rules in schema.rules.values() for rule in rules} == {PatternRule, DateRangeRule, ExclusiveRule}
+    assert schema.rules[multiselect.full_key][0].options == {"None of the above", "Not aware"}
+    assert validate_responses({
+        EMAIL_KEY: "asha@example.org", CONTACT_KEY: "+91 9876543210", RESPONSE_DATE_KEY: date(2024, 1, 31),
+        multiselect.full_key: [none_of_the_above],
+    }, columns, schema) == []
+    assert [column for column, _ in validate_responses({
+        EMAIL_KEY: "asha", CONTACT_KEY: "12345", RESPONSE_DATE_KEY: date(2019, 12, 31),
+        multiselect.full_key: [multiselect.options[0], none_of_the_above],
+    }, columns, schema)] == columns
+
+    frame = pd.DataFrame({
+        EMAIL_KEY: ["asha@example.org", "asha", None],
+        RESPONSE_DATE_KEY: ["31/01/2024", "2019-12-31", ""],
+        multiselect.full_key: [f"{multiselect.options[0]}; {multiselect.options[1]}", f"{multiselect.options[0]}; Not aware", ""],
+    })
+    errors = validate_frame(frame, schema)
+    assert set(zip(errors["row"], errors["column"])) == {(1, EMAIL_KEY), (1, RESPONSE_DATE_KEY), (1, multiselect.full_key)}
+
+
+def test_rules_for_unknown_questions_or_kinds_are_rejected():
+    schema = get_schema("1")
+
+    with pytest.raises(ValueError, match="unknown question"):
+        compile_rules([{"question": "No such question", "rule": "pattern", "regex": "x"}], schema)
+    with pytest.raises(ValueError, match="Unknown validation rule"):
+        compile_rules([{"question": EMAIL_KEY, "rule": "length"}], schema)
@@ -0,0 +1,69 @@
+"""
+Translated question text for the survey.
+
+Translation tables are JSON files in `translations/` named by locale
+(`mr.json`, `kn.json`) holding {"language": <display name>, "text": {English
+text: translation}}. Keys are the English section names, group headings,
+labels and options of the question bank, so one table serves every bank
+version; text without a translation is shown in English.
+
+A table is compiled once per (bank version, locale) into a `Localization`
+with the display text of every question, so rendering does not translate
+anything. Translations only change what is displayed: widgets still return
+the bank's own option strings, so stored answers, scores and exports do not
+depend on the language.
+"""
+import json
+import os
+
+from questions import Group
+
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations")
+DEFAULT_LOCALE = "en"
+UI_TEXT = ("Question", "Response", "Remarks")  # Fixed interface text looked up in the tables
+
+
+def load_tables(directory=TRANSLATIONS_DIR):
+    """
+    Returns locale -> (language name, text table), English (an empty table) first.
+    """
+    tables = {DEFAULT_LOCALE: ("English", {})}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                table = json.load(f)
+            tables[name[:-len(".json")]] = (table["language"], table["text"])
+    return tables
+
+
+class Localization:
+    """
+    Display text of one schema in one language:
+    - `labels`: full key -> question label
+    - `options`: full key -> {option: displayed option}
+    - `sections`: section -> section title
+    - `groups`: group heading -> displayed heading
+    - `ui`: `UI_TEXT` entry -> displayed text
+    """
+    __slots__ = ("locale", "labels", "options", "sections", "groups", "ui")
+
+    def __init__(self, schema, table, locale=DEFAULT_LOCALE):
+        text = lambda s: table.get(s, s)
+        self.locale = locale
+        self.labels = {q.full_key: text(q.label) for q in schema.questions}
+        self.options = {q.full_key: {o: text(o) for o in q.options} for q in schema.questions}
+        self.sections = {section: text(section) for section in schema.section_keys}
+        self.groups = {
+            item.label: text(item.label)
+            for items in schema.layout.values() for item in items if isinstance(item, Group)
+        }
+        self.ui = {s: text(s) for s in UI_TEXT}
+
+    def display(self, full_key, value):
+        """
+        Translates a stored "; "-joined answer for display; other text is returned as is.
+        """
+        options = self.options.get(full_key)
+        if not options:
+            return value
+        return "; ".join(options.get(part, part) for part in value.split("; "))
@@ -0,0 +1,218 @@
+"""
+Declarative validation rules for responses.
+
+Rules are declared per question bank version under the bank's "rules" key,
+e.g.
+
+    {"question": "Respondent and Location Details|Respondent Email ID", "rule": "pattern",
+     "regex": "[^@\\s]+@[^@\\s]+\\.[^@\\s]+", "message": "is not a valid email address"}
+    {"question": "Respondent and Location Details|Date of response", "rule": "date_range",
+     "min": "2020-01-01", "max": "today"}
+    {"widget": "multiselect", "rule": "exclusive", "options": ["None of the above", "Not aware"]}
+
+A rule applies to one question (`question`, its full key) or to every
+question with a given `widget`. Kinds:
+- `pattern`: the whole answer must match `regex`
+- `date_range`: the date must lie within `min`/`max` (ISO dates or "today");
+  stored text is read with `parse_dates()`
+- `exclusive`: the listed options (matched without their "a." style prefix)
+  cannot be combined with other choices; questions without them are skipped
+
+Rules are compiled once per schema (regexes, option sets) into
+`QuestionSchema.rules`. `validate_responses()` checks one session's answers;
+`validate_frame()` checks whole frames of stored text with vectorised pandas
+operations. Blank answers always pass.
+
+Dates in stored text and offline sheets are read with `parse_dates()`, which
+tries the formats in `DATE_FORMATS` in order: ISO first, then the day-first
+forms used in the field.
+"""
+import re
+from datetime import date
+
+import pandas as pd
+
+_OPTION_PREFIX = re.compile(r"^[a-z]\.\s*")
+# Accepted date formats, tried in order. Sheets from the field write DD/MM/YYYY,
+# so day-first forms are explicit rather than guessed.
+DATE_FORMATS = ("ISO8601", "%d/%m/%Y", "%d-%m-%Y")
+
+
+def parse_dates(values):
+    """
+    Parses a Series of date text against `DATE_FORMATS`, each cell with the
+    first format it matches. Blank or unparseable cells become NaT.
+    """
+    values = values.fillna("").astype(str).str.strip()
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    for fmt in DATE_FORMATS:
+        pending = parsed.isna() & values.ne("")
+        if not pending.any():
+            break
+        parsed = parsed.fillna(pd.to_datetime(values[pending], format=fmt, errors="coerce"))
+    return parsed
+
+
+def _is_blank(value):
+    return value is None or value == "" or value == []
+
+
+class Rule:
+    __slots__ = ("column", "message")
+
+    def __init__(self, column, message):
+        self.column = column
+        self.message = message
+
+    def check(self, value):
+        """
+        Returns True if a session value (text, list or date) is valid.
+        """
+        raise NotImplementedError
+
+    def invalid(self, values):
+        """
+        Returns a boolean mask of the invalid cells in a Series of stored text
+        ("" for blanks).
+        """
+        raise NotImplementedError
+
+
+class PatternRule(Rule):
+    __slots__ = ("regex",)
+
+    def __init__(self, column, regex, message=None):
+        super().__init__(column, message or "is not in the expected format")
+        self.regex = re.compile(regex)
+
+    def check(self, value):
+        return _is_blank(value) or self.regex.fullmatch(str(value).strip()) is not None
+
+    def invalid(self, values):
+        values = values.str.strip()
+        return values.ne("") & ~values.str.fullmatch(self.regex).fillna(False)
+
+
+class DateRangeRule(Rule):
+    __slots__ = ("min", "max")
+
+    def __init__(self, column, min=None, max=None, message=None):
+        super().__init__(column, message or f"must be between {min or 'any date'} and {max or 'any date'}")
+        # "today" is resolved on every check, so a long-running server keeps up with the date.
+        self.min = min
+        self.max = max
+
+    @staticmethod
+    def _bound(bound):
+        if bound is None:
+            return None
+        return date.today() if bound == "today" else date.fromisoformat(bound)
+
+    def check(self, value):
+        if _is_blank(value):
+            return True
+        try:
+            value = value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+        except ValueError:
+            return False
+        low, high = self._bound(self.min), self._bound(self.max)
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    def invalid(self, values):
+        parsed = parse_dates(values)
+        bad = values.str.strip().ne("") & parsed.isna()
+        low, high = self._bound(self.min), self._bound(self.max)
+        if low is not None:
+            bad |= parsed < pd.Timestamp(low)
+        if high is not None:
+            bad |= parsed > pd.Timestamp(high)
+        return bad
+
+
+class ExclusiveRule(Rule):
+    __slots__ = ("options",)
+
+    def __init__(self, column, options, message=None):
+        super().__init__(column, message or f"cannot combine {' / '.join(sorted(options))} with other choices")
+        self.options = frozenset(options)
+
+    def check(self, value):
+        if not isinstance(value, list):
+            value = [v.strip() for v in str(value or "").split(";") if v.strip()]
+        return len(value) < 2 or self.options.isdisjoint(value)
+
+    def invalid(self, values):
+        choices = values[values.ne("")].str.split(";").explode().str.strip()
+        per_row = choices.isin(self.options).groupby(level=0).agg(["any", "size"])
+        bad = per_row["any"] & per_row["size"].gt(1)
+        return bad.reindex(values.index, fill_value=False)
+
+
+def _targets(spec, schema):
+    if "question" in spec:
+        question = schema.by_key.get(spec["question"])
+        if question is None:
+            raise ValueError(f"Validation rule for unknown question {spec['question']!r}")
+        return [question]
+    return [q for q in schema.questions if q.widget == spec["widget"]]
+
+
+def compile_rules(specs, schema):
+    """
+    Compiles rule declarations against a schema. Returns column -> tuple of rules.
+    """
+    rules = {}
+    for spec in specs:
+        kind = spec["rule"]
+        for question in _targets(spec, schema):
+            column = question.full_key
+            message = spec.get("message")
+            if kind == "pattern":
+                rule = PatternRule(column, spec["regex"], message)
+            elif kind == "date_range":
+                rule = DateRangeRule(column, spec.get("min"), spec.get("max"), message)
+            elif kind == "exclusive":
+                wanted = set(spec["options"])
+                options = [o for o in question.options if _OPTION_PREFIX.sub("", o).strip() in wanted]
+                if not options:
+                    continue
+                rule = ExclusiveRule(column, options, message)
+            else:
+                raise ValueError(f"Unknown validation rule {kind!r}")
+            rules.setdefault(column, []).append(rule)
+    return {column: tuple(column_rules) for column, column_rules in rules.items()}
+
+
+def validate_responses(responses, columns, schema):
+    """
+    Checks one session's answers for `columns`. Returns a list of
+    (column, message) for every failed rule.
+    """
+    errors = []
+    for column in columns:
+        for rule in schema.rules.get(column, ()):
+            if not rule.check(responses.get(column)):
+                errors.append((column, rule.message))
+    return errors
+
+
+def validate_frame(df, schema):
+    """
+    Checks a frame of stored text ("" for blanks) against every rule whose
+    column it has. Returns one row per invalid cell: row (frame index),
+    column, value, error.
+    """
+    errors = []
+    for column, rules in schema.rules.items():
+        if column not in df.columns:
+            continue
+        values = df[column].fillna("").astype(str)
+        for rule in rules:
+            mask = rule.invalid(values)
+            if mask.any():
+                errors.append(pd.DataFrame({
+                    "row": df.index[mask], "column": column, "value": values[mask], "error": rule.message,
+                }))
+    if not errors:
+        return pd.DataFrame(columns=["row", "column", "value", "error"])
+    return pd.concat(errors, ignore_index=True)